@@ -0,0 +1,112 @@
+"""
+EPAM Practice Database - Lookup Benchmark
+Compares the old per-row SELECT round-trips against the in-memory lookups
+now used by the order_items and sales generators.
+
+Both strategies run the shipped python_generators code. The generators only
+index and len() their product_prices / rep_commission_rates arguments, so
+the old strategy is a mapping that answers every lookup with a SELECT and
+the new one is the plain dict. With the same seed both produce the same
+rows, which the benchmark checks.
+"""
+
+import argparse
+import random
+import sqlite3
+import time
+from datetime import date
+
+import python_generators
+
+REFERENCE_DATE = date(2024, 12, 31)
+
+
+class QueryLookup:
+    """Read-only mapping that runs one SELECT per lookup, as the generators once did"""
+
+    def __init__(self, cursor, sql, size):
+        self.cursor = cursor
+        self.sql = sql
+        self.size = size
+
+    def __getitem__(self, key):
+        self.cursor.execute(self.sql, (key,))
+        return self.cursor.fetchone()[0]
+
+    def __len__(self):
+        return self.size
+
+
+def build_dimension_tables(cursor, num_products=54, num_reps=50):
+    """Create the products and sales_reps columns the generators read"""
+    cursor.execute('CREATE TABLE products (product_id INTEGER PRIMARY KEY, price DECIMAL(10,2) NOT NULL)')
+    cursor.execute('CREATE TABLE sales_reps (rep_id INTEGER PRIMARY KEY, commission_rate DECIMAL(5,2))')
+
+    prices = [29.99, 49.99, 79.99, 99.99, 149.99, 199.99, 299.99, 499.99, 699.99, 999.99, 1299.99, 1599.99]
+    products_data = [(i + 1, random.choice(prices)) for i in range(num_products)]
+    sales_reps_data = [(i + 1, round(random.uniform(0.02, 0.08), 2)) for i in range(num_reps)]
+
+    cursor.executemany('INSERT INTO products VALUES (?,?)', products_data)
+    cursor.executemany('INSERT INTO sales_reps VALUES (?,?)', sales_reps_data)
+    return dict(products_data), dict(sales_reps_data)
+
+
+def generate_order_items(num_orders, product_prices, seed):
+    """All rows of python_generators.generate_order_items"""
+    return list(python_generators.generate_order_items(num_orders, product_prices, seed=seed))
+
+
+def generate_sales(num_sales, rep_commission_rates, num_products, seed):
+    """All rows of python_generators.generate_sales"""
+    return list(python_generators.generate_sales(num_sales, rep_commission_rates, num_products,
+                                                 REFERENCE_DATE, seed=seed))
+
+
+def timed(func, *args):
+    """Run func and return (result, seconds)"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_benchmark(num_sales=45000, num_orders=2000, seed=42):
+    """Time both strategies for both generators and print a comparison"""
+    random.seed(seed)
+    conn = sqlite3.connect(':memory:')
+    cursor = conn.cursor()
+    product_prices, rep_commission_rates = build_dimension_tables(cursor)
+    price_queries = QueryLookup(cursor, 'SELECT price FROM products WHERE product_id = ?', len(product_prices))
+    rate_queries = QueryLookup(cursor, 'SELECT commission_rate FROM sales_reps WHERE rep_id = ?',
+                               len(rep_commission_rates))
+
+    results = []
+
+    old_rows, old_time = timed(generate_order_items, num_orders, price_queries, seed)
+    new_rows, new_time = timed(generate_order_items, num_orders, product_prices, seed)
+    results.append(('order_items', len(new_rows), old_time, new_time, old_rows == new_rows))
+
+    old_rows, old_time = timed(generate_sales, num_sales, rate_queries, len(product_prices), seed)
+    new_rows, new_time = timed(generate_sales, num_sales, rep_commission_rates, len(product_prices), seed)
+    results.append(('sales', len(new_rows), old_time, new_time, old_rows == new_rows))
+
+    conn.close()
+
+    print("Table        |      Rows | SELECT/row | Lookup  | Speedup | Same rows")
+    print("-------------|-----------|------------|---------|---------|----------")
+    for table, rows, old_time, new_time, same in results:
+        print(f"{table:12} | {rows:9,} | {old_time:9.3f}s | {new_time:6.3f}s | "
+              f"{old_time / new_time:6.1f}x | {'yes' if same else 'NO'}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare per-row SELECTs with in-memory lookups")
+    parser.add_argument('--sales', type=int, default=45000, help="sales rows to generate")
+    parser.add_argument('--orders', type=int, default=2000, help="orders whose line items are generated")
+    parser.add_argument('--seed', type=int, default=42, help="seed of the dimension tables and generators")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("⏱️  GENERATOR LOOKUP BENCHMARK")
+    print("="*70)
+    run_benchmark(num_sales=args.sales, num_orders=args.orders, seed=args.seed)
@@ -0,0 +1,149 @@
+"""
+EPAM Practice Database - Build Phase Instrumentation
+Wall time, CPU time, rows/s and memory per phase of the setup pipeline.
+
+create_enhanced_database() runs every step inside a named phase (drop, ddl,
+generate, insert, index, analyze, commit, ...). Phases nest, and time is
+always charged to the innermost one: the generate phase of a table excludes
+the executemany() calls of its insert phase, so the phase times add up to
+the build time and show which step to optimize at a given scale factor.
+
+Per phase the recorder keeps:
+- wall and CPU seconds (CPU of this process only; worker processes of
+  --workers show up as wall time spent waiting in generate)
+- rows processed and rows/s
+- the process high-water RSS when the phase last ended (Unix only)
+- with trace_memory, the peak Python allocation (tracemalloc) inside the
+  phase; tracing makes generation noticeably slower, so it is opt-in
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+
+def max_rss_kb():
+    """High-water resident set size of this process in KB (None where unsupported)"""
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class PhaseRecorder:
+    """Exclusive wall/CPU time, rows and memory per named phase"""
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.phases = {}
+        self.stack = []  # [name, wall mark, cpu mark] of the open phases, innermost last
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def _entry(self, name):
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = {'calls': 0, 'wall_s': 0.0, 'cpu_s': 0.0, 'rows': 0,
+                                         'max_rss_kb': None, 'peak_python_kb': None}
+        return entry
+
+    def _charge_innermost(self):
+        """Add the time since the last mark to the innermost open phase"""
+        wall, cpu = time.perf_counter(), time.process_time()
+        if self.stack:
+            name, wall_mark, cpu_mark = self.stack[-1]
+            entry = self._entry(name)
+            entry['wall_s'] += wall - wall_mark
+            entry['cpu_s'] += cpu - cpu_mark
+            self.stack[-1][1:] = [wall, cpu]
+            if self.trace_memory:
+                peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+                entry['peak_python_kb'] = max(entry['peak_python_kb'] or 0, peak_kb)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        return wall, cpu
+
+    @contextmanager
+    def phase(self, name, rows=0):
+        """Run the with-block as (part of) phase name, adding rows to its count"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        wall, cpu = self._charge_innermost()
+        self.stack.append([name, wall, cpu])
+        try:
+            yield
+        finally:
+            wall, cpu = self._charge_innermost()
+            self.stack.pop()
+            if self.stack:
+                self.stack[-1][1:] = [wall, cpu]  # the enclosing phase resumes now
+            entry = self._entry(name)
+            entry['calls'] += 1
+            entry['rows'] += rows
+            entry['max_rss_kb'] = max_rss_kb()
+
+    def add_rows(self, name, rows):
+        """Count rows for a phase after the fact (e.g. once a chunk's size is known)"""
+        self._entry(name)['rows'] += rows
+
+    def report(self):
+        """JSON-ready summary of every phase, in the order they first ran"""
+        total_wall = time.perf_counter() - self.wall_start
+        total_cpu = time.process_time() - self.cpu_start
+        phases = {}
+        for name, entry in self.phases.items():
+            phases[name] = dict(
+                entry,
+                wall_s=round(entry['wall_s'], 4),
+                cpu_s=round(entry['cpu_s'], 4),
+                rows_per_s=round(entry['rows'] / entry['wall_s']) if entry['rows'] and entry['wall_s'] else None,
+                peak_python_kb=None if entry['peak_python_kb'] is None else round(entry['peak_python_kb']),
+            )
+        return {
+            'total_wall_s': round(total_wall, 4),
+            'total_cpu_s': round(total_cpu, 4),
+            'unaccounted_wall_s': round(total_wall - sum(e['wall_s'] for e in self.phases.values()), 4),
+            'max_rss_kb': max_rss_kb(),
+            'trace_memory': self.trace_memory,
+            'phases': phases,
+        }
+
+    def write_json(self, path, **context):
+        """Write report() plus context (scale factor, engine, ...) to a JSON file"""
+        with open(path, 'w') as f:
+            json.dump(dict(context, **self.report()), f, indent=2)
+
+    def print_table(self):
+        """Console table of the phases, slowest first"""
+        report = self.report()
+        print("\n⏱️  BUILD PHASES:")
+        print("   Phase      |  Wall s |   CPU s |  Share |      Rows |    Rows/s | Max RSS MB | Py peak MB")
+        print("   -----------|---------|---------|--------|-----------|-----------|------------|-----------")
+        phases = sorted(report['phases'].items(), key=lambda item: item[1]['wall_s'], reverse=True)
+        for name, entry in phases:
+            share = entry['wall_s'] / report['total_wall_s'] * 100 if report['total_wall_s'] else 0
+            rows_per_s = f"{entry['rows_per_s']:9,}" if entry['rows_per_s'] else f"{'-':>9}"
+            rss = f"{entry['max_rss_kb'] / 1024:10.1f}" if entry['max_rss_kb'] else f"{'-':>10}"
+            peak = f"{entry['peak_python_kb'] / 1024:10.1f}" if entry['peak_python_kb'] is not None else f"{'-':>10}"
+            print(f"   {name:10} | {entry['wall_s']:7.2f} | {entry['cpu_s']:7.2f} | {share:5.1f}% | "
+                  f"{entry['rows']:9,} | {rows_per_s} | {rss} | {peak}")
+        print(f"   {'total':10} | {report['total_wall_s']:7.2f} | {report['total_cpu_s']:7.2f} | "
+              f"100.0% (unaccounted {report['unaccounted_wall_s']:.2f}s)")
+
+
+class NullPhaseRecorder:
+    """Stand-in that records nothing, for loaders used outside the setup pipeline"""
+
+    def phase(self, name, rows=0):
+        return nullcontext()
+
+    def add_rows(self, name, rows):
+        pass
+
+
+NO_PHASES = NullPhaseRecorder()
@@ -0,0 +1,97 @@
+"""
+EPAM Practice Database - Prebuilt Database Cache
+Content-addressed cache of finished practice databases.
+
+A seeded build is fully determined by the generator code, the profile, the
+seed, the scale factor, the engine and the reference date, plus the
+bulk-load settings (they change the page size and add ANALYZE statistics),
+so the finished file is stored under a hash of exactly those inputs. The next setup with the
+same inputs copies the cached file into place with the SQLite backup API
+instead of generating everything again. Editing any generator source changes the key,
+so stale files are never reused.
+"""
+
+import hashlib
+import json
+import os
+from db_connection import connect
+
+# Cached databases live outside the repository unless EPAM_DB_CACHE says otherwise
+DEFAULT_CACHE_DIR = os.environ.get(
+    'EPAM_DB_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'epam_practice')
+)
+
+# Every file whose code decides what ends up in the database
+GENERATOR_SOURCES = [
+    'enhanced_database_setup.py',
+    'schema_registry.py',
+    'python_generators.py',
+    'numpy_generators.py',
+    'faker_pool.py',
+    'table_loaders.py',
+    'sales_summaries.py',
+]
+
+
+def generator_version():
+    """Hash of the generator sources: the 'script version' part of the key"""
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in GENERATOR_SOURCES:
+        with open(os.path.join(here, name), 'rb') as source:
+            digest.update(name.encode() + b'\0' + source.read() + b'\0')
+    return digest.hexdigest()
+
+
+def cache_key(profile, seed, scale_factor, engine, reference_date, bulk_load=False, bulk_journal_mode='OFF'):
+    """Content address of a seeded build"""
+    inputs = {
+        'version': generator_version(),
+        'profile': profile,
+        'seed': seed,
+        'scale_factor': float(scale_factor),
+        'engine': engine,
+        'reference_date': str(reference_date),
+        'bulk_load': bulk_journal_mode if bulk_load else None,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()[:32]
+
+
+def cached_path(cache_dir, key):
+    """Where the database for a key is (or would be) stored"""
+    return os.path.join(cache_dir, f'epam_practice_{key}.db')
+
+
+def _backup(source_path, target_path):
+    """Copy a whole database page by page with sqlite3's online backup API
+
+    Either side may be an in-memory database (see db_connection.py).
+    """
+    source = connect(source_path)
+    target = connect(target_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def restore(cache_dir, key, db_path):
+    """Copy the cached database for key over db_path; False on a cache miss"""
+    path = cached_path(cache_dir, key)
+    if not os.path.exists(path):
+        return False
+    _backup(path, db_path)
+    return True
+
+
+def store(cache_dir, key, db_path):
+    """Add a finished database to the cache (written atomically)"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = cached_path(cache_dir, key)
+    partial_path = f'{path}.{os.getpid()}.partial'
+    if os.path.exists(partial_path):
+        os.remove(partial_path)
+    _backup(db_path, partial_path)
+    os.replace(partial_path, path)
+    return path
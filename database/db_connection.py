@@ -0,0 +1,126 @@
+"""
+EPAM Practice Database - Database Paths and Connections
+One place that knows where the practice database lives and how to open it.
+
+db_path is either a file name (DEFAULT_DB_PATH unless told otherwise) or an
+in-memory database. A plain ':memory:' database belongs to the one
+connection that created it, so the setup, smoke test and benchmarks could
+never share it; it is therefore mapped to MEMORY_DB_URI, a named shared-cache
+in-memory database that every connection of this process sees. It lives as
+long as at least one connection to it stays open:
+
+    keeper = connect(MEMORY_DB_URI)
+    create_enhanced_database(db_path=MEMORY_DB_URI)
+    test_enhanced_database(MEMORY_DB_URI)
+    snapshot(MEMORY_DB_URI, 'epam_practice.db')
+    keeper.close()
+
+snapshot() writes any database to disk with the backup API.
+
+connect() can also profile and trace the connection (see sql_profiler.py);
+enable_profiling() and enable_tracing() turn that on for every connection
+opened afterwards.
+"""
+
+import atexit
+import os
+import sqlite3
+from sql_profiler import ProfiledConnection, StatementProfiler
+
+DEFAULT_DB_PATH = 'epam_practice.db'
+
+# Shared-cache in-memory database used for ':memory:' builds
+MEMORY_DB_URI = 'file:epam_practice?mode=memory&cache=shared'
+
+# Profiler and trace callback applied to every connect() call, see enable_profiling()/enable_tracing()
+_default_profiler = None
+_default_trace = None
+
+
+def resolve(db_path):
+    """The path or URI actually opened for db_path"""
+    return MEMORY_DB_URI if db_path == ':memory:' else db_path
+
+
+def is_uri(db_path):
+    """True when db_path is opened as a file: URI"""
+    return resolve(db_path).startswith('file:')
+
+
+def is_memory(db_path):
+    """True for ':memory:' and in-memory URIs (mode=memory)"""
+    path = resolve(db_path)
+    return is_uri(path) and 'mode=memory' in path
+
+
+def exists(db_path):
+    """True when db_path names a database file on disk (in-memory databases always 'exist')"""
+    return is_memory(db_path) or is_uri(db_path) or os.path.exists(db_path)
+
+
+def connect(db_path=DEFAULT_DB_PATH, read_only=False, profiler=None, trace=None, **kwargs):
+    """Open db_path; read_only uses mode=ro for files and PRAGMA query_only in memory
+
+    profiler (a sql_profiler.StatementProfiler) times every statement and
+    counts its VM steps; trace is called with the text of every statement
+    SQLite runs, bound values filled in. Both default to what
+    enable_profiling() and enable_tracing() set. Extra keyword arguments go to sqlite3.connect
+    (isolation_level, cached_statements, ...).
+    """
+    profiler = profiler or _default_profiler
+    trace = trace or _default_trace
+    if profiler:
+        kwargs['factory'] = ProfiledConnection
+    path = resolve(db_path)
+    if is_uri(path):
+        conn = sqlite3.connect(path, uri=True, **kwargs)
+    elif read_only:
+        conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True, **kwargs)
+    else:
+        conn = sqlite3.connect(path, **kwargs)
+    if profiler:
+        conn.profiler = profiler
+        profiler.install(conn)
+    if trace:
+        conn.set_trace_callback(trace)
+    if read_only and is_uri(path):
+        conn.execute('PRAGMA query_only = ON')
+    return conn
+
+
+def enable_profiling(top=10, trace_path=None):
+    """Profile every connection opened from now on and print the top statements at exit
+
+    trace_path additionally logs every statement to that file (see
+    enable_tracing()). Returns the shared StatementProfiler.
+    """
+    global _default_profiler
+    _default_profiler = StatementProfiler()
+    atexit.register(_default_profiler.print_report, top)
+    if trace_path:
+        enable_tracing(trace_path)
+    return _default_profiler
+
+
+def enable_tracing(trace_path):
+    """Log every statement of every connection opened from now on to trace_path"""
+    global _default_trace
+    trace_file = open(trace_path, 'w')
+    atexit.register(trace_file.close)
+    _default_trace = lambda sql: trace_file.write(sql + '\n')
+
+
+def snapshot(db_path, target_path):
+    """Copy db_path to the file target_path with the backup API (written atomically)"""
+    partial_path = f'{target_path}.{os.getpid()}.partial'
+    if os.path.exists(partial_path):
+        os.remove(partial_path)
+    source = connect(db_path)
+    target = sqlite3.connect(partial_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+    os.replace(partial_path, target_path)
+    return target_path
@@ -0,0 +1,56 @@
+"""
+EPAM Practice Database - Faker Value Pool
+Sample Faker values once, then draw rows from the samples.
+
+Faker builds every name, phone number and address from scratch and is by far
+the slowest part of row generation. A FakerPool calls Faker at most `size`
+times per field, the first time the field is used, and afterwards every row
+just picks one of the sampled values: rng.choice() for the row-at-a-time
+generators, a NumPy index array for the vectorized ones. The number of Faker
+calls no longer grows with the number of rows.
+
+Faker itself is imported only when a pool first samples it: it is the
+heaviest import of the setup, and code paths that never generate names (a
+cache hit, a worker process that only builds sales) should not pay for it.
+"""
+
+POOL_SIZE = 2000  # Distinct values sampled per field
+
+
+class FakerPool:
+    """Lazily sampled Faker values (first_name, last_name, name, address, ...)
+
+    provider can be any object with Faker-style methods (see
+    python_generators.StdlibNames); by default it is a seeded Faker instance.
+    """
+
+    def __init__(self, seed=None, size=POOL_SIZE, provider=None):
+        self.seed = seed
+        self.size = max(1, size)
+        self.provider = provider
+        self.values = {}
+        self.arrays = {}
+
+    def sample(self, field):
+        """The sampled values of a provider method, e.g. 'first_name'"""
+        if field not in self.values:
+            if self.provider is None:
+                from faker import Faker
+                self.provider = Faker()
+                if self.seed is not None:
+                    self.provider.seed_instance(self.seed)
+            method = getattr(self.provider, field)
+            self.values[field] = [method() for _ in range(self.size)]
+        return self.values[field]
+
+    def pick(self, rng, field):
+        """One value drawn with a random.Random-style rng"""
+        return rng.choice(self.sample(field))
+
+    def take(self, rng, field, size):
+        """size values drawn with a NumPy Generator, as a string array"""
+        if field not in self.arrays:
+            import numpy as np
+            self.arrays[field] = np.array(self.sample(field))
+        values = self.arrays[field]
+        return values[rng.integers(0, len(values), size)]
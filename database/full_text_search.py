@@ -0,0 +1,184 @@
+"""
+EPAM Practice Database - Full-Text Search
+Optional SQLite FTS5 indexes over product names, customer names and order addresses.
+
+LIKE '%word%' cannot use a B-tree index, so every such query scans the whole
+table. The FTS5 tables below are external-content indexes: they store only
+the tokens and point back at the rows of products, customers and orders by
+rowid. Triggers on the base tables keep them in sync, so rows added later
+(for example by --append-days) are searchable right away.
+
+    SELECT c.* FROM customers c
+    JOIN customers_fts f ON f.rowid = c.customer_id
+    WHERE customers_fts MATCH 'last_name:smith';
+
+Run this file to add the indexes to an existing database, or with
+--benchmark to compare MATCH queries with their LIKE equivalents.
+"""
+
+import argparse
+import json
+import random
+import sqlite3
+import statistics
+import time
+from db_connection import DEFAULT_DB_PATH, connect
+
+# fts table -> (content table, rowid column, indexed columns)
+FTS_TABLES = {
+    'products_fts': ('products', 'product_id', ['product_name']),
+    'customers_fts': ('customers', 'customer_id', ['first_name', 'last_name', 'email', 'city']),
+    'orders_fts': ('orders', 'order_id', ['shipping_address', 'billing_address']),
+}
+
+# (fts table, column searched, SQL to draw search words from)
+BENCHMARK_SEARCHES = [
+    ('products_fts', 'product_name', "SELECT product_name FROM products"),
+    ('customers_fts', 'last_name', "SELECT last_name FROM customers"),
+    ('orders_fts', 'shipping_address', "SELECT shipping_address FROM orders"),
+]
+
+
+def fts5_available(conn):
+    """True when this SQLite build has the FTS5 extension"""
+    return conn.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')").fetchone()[0] == 1
+
+
+def create_fts(conn):
+    """Create (or rebuild) every FTS table and the triggers that keep it in sync"""
+    if not fts5_available(conn):
+        raise RuntimeError("this SQLite build has no FTS5 support")
+    for fts, (table, rowid, columns) in FTS_TABLES.items():
+        column_list = ', '.join(columns)
+        new_values = ', '.join(f'new.{column}' for column in columns)
+        old_values = ', '.join(f'old.{column}' for column in columns)
+        drop_fts_table(conn, fts)
+        conn.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({column_list}, "
+                     f"content='{table}', content_rowid='{rowid}')")
+        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        conn.execute(f'''
+            CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{rowid}, {new_values});
+            END''')
+        conn.execute(f'''
+            CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{rowid}, {old_values});
+            END''')
+        conn.execute(f'''
+            CREATE TRIGGER {fts}_update AFTER UPDATE ON {table} BEGIN
+                INSERT INTO {fts}({fts}, rowid, {column_list}) VALUES ('delete', old.{rowid}, {old_values});
+                INSERT INTO {fts}(rowid, {column_list}) VALUES (new.{rowid}, {new_values});
+            END''')
+    conn.commit()
+
+
+def drop_fts_table(conn, fts):
+    """Drop one FTS table and its sync triggers"""
+    for suffix in ['insert', 'delete', 'update']:
+        conn.execute(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+    conn.execute(f"DROP TABLE IF EXISTS {fts}")
+
+
+def drop_fts(conn):
+    """Remove every FTS table, e.g. before the base tables are rebuilt"""
+    for fts in FTS_TABLES:
+        drop_fts_table(conn, fts)
+    conn.commit()
+
+
+def search_words(conn, sql, count, rng):
+    """count distinct alphabetic words (3+ letters) sampled from the values of sql"""
+    words = sorted({
+        word for (value,) in conn.execute(sql) if value
+        for word in value.replace(',', ' ').split() if word.isalpha() and len(word) >= 3
+    })
+    return rng.sample(words, min(count, len(words)))
+
+
+def _best_ms(conn, sql, params, repeat):
+    best, rows = None, 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = len(conn.execute(sql, params).fetchall())
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, rows
+
+
+def benchmark(conn, words_per_table=10, repeat=3, seed=None):
+    """Time MATCH against LIKE for words drawn from each indexed column
+
+    LIKE matches substrings and MATCH whole tokens, so the row counts can
+    differ slightly (LIKE '%Lee%' also finds 'Leeds'); both are reported.
+    """
+    rng = random.Random(seed)
+    results = []
+    for fts, column, words_sql in BENCHMARK_SEARCHES:
+        table, rowid, _ = FTS_TABLES[fts]
+        like_sql = f"SELECT * FROM {table} WHERE {column} LIKE ?"
+        match_sql = (f"SELECT t.* FROM {table} t JOIN {fts} f ON f.rowid = t.{rowid} "
+                     f"WHERE {fts} MATCH ?")
+        for word in search_words(conn, words_sql, words_per_table, rng):
+            like_ms, like_rows = _best_ms(conn, like_sql, (f'%{word}%',), repeat)
+            match_ms, match_rows = _best_ms(conn, match_sql, (f'{column}:"{word}"',), repeat)
+            results.append({
+                'table': table,
+                'column': column,
+                'word': word,
+                'like_ms': round(like_ms, 3),
+                'like_rows': like_rows,
+                'match_ms': round(match_ms, 3),
+                'match_rows': match_rows,
+                'speedup': round(like_ms / match_ms, 1) if match_ms else None,
+            })
+    return results
+
+
+def print_benchmark(results):
+    """Median LIKE vs MATCH time per searched column"""
+    print("   Column                       | Words | LIKE ms | MATCH ms | Speedup")
+    print("   -----------------------------|-------|---------|----------|--------")
+    columns = {}
+    for result in results:
+        columns.setdefault(f"{result['table']}.{result['column']}", []).append(result)
+    for column, rows in columns.items():
+        like_ms = statistics.median(r['like_ms'] for r in rows)
+        match_ms = statistics.median(r['match_ms'] for r in rows)
+        print(f"   {column:28} | {len(rows):5} | {like_ms:7.2f} | {match_ms:8.3f} | "
+              f"{like_ms / match_ms if match_ms else 0:6.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add FTS5 search indexes and compare them with LIKE")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to index")
+    parser.add_argument('--drop', action='store_true', help="remove the FTS tables and triggers instead")
+    parser.add_argument('--benchmark', action='store_true', help="time MATCH against LIKE afterwards")
+    parser.add_argument('--words', type=int, default=10, help="search words per column for --benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per query; the fastest is used")
+    parser.add_argument('--seed', type=int, help="seed for the sampled search words")
+    parser.add_argument('--json', help="write the benchmark results to this JSON file")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🔎 FULL-TEXT SEARCH")
+    print("="*70)
+    conn = connect(args.db)
+    try:
+        if args.drop:
+            drop_fts(conn)
+            print("✅ Dropped the FTS tables and triggers")
+        else:
+            start = time.perf_counter()
+            create_fts(conn)
+            print(f"✅ Created {', '.join(FTS_TABLES)} in {time.perf_counter() - start:.2f}s")
+
+        if args.benchmark and not args.drop:
+            results = benchmark(conn, args.words, args.repeat, args.seed)
+            print()
+            print_benchmark(results)
+            if args.json:
+                with open(args.json, 'w') as f:
+                    json.dump({'sqlite_version': sqlite3.sqlite_version, 'results': results}, f, indent=2)
+                print(f"\n💾 Results written to {args.json}")
+    finally:
+        conn.close()
@@ -0,0 +1,227 @@
+"""
+EPAM Practice Database - Direct File Generation
+Writes the fact tables straight to CSV, gzip CSV or Parquet, without SQLite.
+
+The pandas and file-processing exercises only need input files, and
+generating into SQLite and exporting afterwards pays for every insert and
+index twice. Here the same schema_registry builders run as in
+enhanced_database_setup.py: the small dimension tables go into a throwaway
+in-memory SQLite database, because the fact generators need their rows
+(product prices, commission rates), and FileTableLoader writes the scaled
+tables to files instead of inserting them. Tables and seeds are the ones a
+SQLite build uses, so for a fixed seed the files hold exactly the rows of
+the matching database.
+
+Every table, and every month of sales, is one task writing its own file:
+
+    files/sales/part-000.csv.gz ... part-011.csv.gz
+    files/orders/part-000.csv.gz
+
+With --workers the tasks run in a process pool.
+"""
+
+import argparse
+import csv
+import gzip
+import importlib
+import os
+import random
+import shutil
+import sqlite3
+import time
+from datetime import date
+from itertools import islice
+
+from enhanced_database_setup import (
+    DIMENSION_POOL_SIZE, GENERATION_ENGINES, SEEDED_REFERENCE_DATE, iso_date, load_generators,
+    positive_float, positive_int, scaled_row_counts
+)
+from parquet_export import COMPRESSIONS, arrow_schema, load_pyarrow, table_columns, write_parquet
+from python_generators import derive_seed, make_pool
+from schema_registry import PROFILES, BuildContext, plan
+from table_loaders import DEFAULT_CHUNK_SIZE, TableLoader
+
+# format -> file extension
+FILE_FORMATS = {
+    'csv': '.csv',
+    'csv.gz': '.csv.gz',
+    'parquet': '.parquet',
+}
+FILE_TABLES = ['orders', 'order_items', 'sales', 'financial_transactions']
+
+
+def _chunks(rows, chunk_size):
+    rows = iter(rows)
+    return iter(lambda: list(islice(rows, chunk_size)), [])
+
+
+def write_rows(file_format, path, columns, rows, chunk_size=DEFAULT_CHUNK_SIZE, compression='snappy'):
+    """Stream rows into one file with a header (CSV) or schema (Parquet); returns the rows written"""
+    if file_format == 'parquet':
+        pa, pq = load_pyarrow()
+        compression = None if compression == 'none' else compression
+        return write_parquet(pa, pq, _chunks(rows, chunk_size), arrow_schema(pa, columns), path, compression)
+
+    opener = gzip.open if file_format == 'csv.gz' else open
+    written = 0
+    with opener(path, 'wt', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow([name for name, _ in columns])
+        for chunk in _chunks(rows, chunk_size):
+            writer.writerows(chunk)
+            written += len(chunk)
+    return written
+
+
+def write_file_partition(generators_module, file_format, path, columns, generator_name, args, seed,
+                         chunk_size, compression):
+    """Worker: generate one table (or partition) into one file"""
+    generators = importlib.import_module(generators_module)
+    rows = getattr(generators, generator_name)(*args, seed=seed)
+    return write_rows(file_format, path, columns, rows, chunk_size, compression)
+
+
+class FileTableLoader(TableLoader):
+    """Write the requested scaled tables to files instead of inserting them
+
+    Scaled tables that were not requested are skipped. finish() returns
+    {table: (rows, files)}.
+    """
+
+    def __init__(self, conn, generators, output_dir, file_format='csv', tables=FILE_TABLES, workers=1,
+                 chunk_size=DEFAULT_CHUNK_SIZE, seed=None, compression='snappy'):
+        super().__init__(conn, generators, chunk_size, 'table', seed)
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.tables = list(tables)
+        self.compression = compression
+        self.executor = None
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor  # Only parallel runs pay for multiprocessing
+            self.executor = ProcessPoolExecutor(max_workers=workers)
+        self.written = []  # (table, rows or a future of them)
+
+    def _run(self, table, insert_sql, tasks):
+        if table not in self.tables:
+            return
+        columns = table_columns(self.conn, table)
+        table_dir = os.path.join(self.output_dir, table)
+        shutil.rmtree(table_dir, ignore_errors=True)
+        os.makedirs(table_dir)
+        for index, (generator_name, args, seed) in enumerate(tasks):
+            path = os.path.join(table_dir, f'part-{index:03d}{FILE_FORMATS[self.file_format]}')
+            task = (self.generators.__name__, self.file_format, path, columns, generator_name, args, seed,
+                    self.chunk_size, self.compression)
+            if self.executor:
+                self.written.append((table, self.executor.submit(write_file_partition, *task)))
+            else:
+                self.written.append((table, write_file_partition(*task)))
+
+    def finish(self):
+        """Wait for the workers; returns {table: (rows, files)}"""
+        totals = {}
+        try:
+            for table, rows in self.written:
+                if self.executor:
+                    rows = rows.result()
+                table_rows, files = totals.get(table, (0, 0))
+                totals[table] = (table_rows + rows, files + 1)
+        finally:
+            self.close()
+        return totals
+
+    def close(self):
+        """Stop the workers, if any"""
+        if self.executor:
+            self.executor.shutdown(cancel_futures=True)
+
+
+def generate_files(output_dir, file_format='csv', tables=FILE_TABLES, scale_factor=1, engine='python',
+                   workers=1, seed=None, reference_date=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                   compression='snappy', profile='enhanced'):
+    """Generate tables straight into output_dir/<table>/part-NNN.<ext>; returns {table: (rows, files)}
+
+    The arguments mean the same as for create_enhanced_database(); tables
+    picks the scaled tables to write (default FILE_TABLES).
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unknown file format: {file_format}")
+    if profile not in ('enhanced', 'stdlib'):
+        raise ValueError("Files can only be generated for the enhanced and stdlib profiles")
+    specs = plan(PROFILES[profile]['tables'])
+    unknown = set(tables) - {spec.name for spec in specs}
+    if unknown:
+        raise ValueError(f"Unknown table(s): {', '.join(sorted(unknown))}")
+    if file_format == 'parquet':
+        load_pyarrow()  # Fail before generating anything
+    names = PROFILES[profile]['names']
+    generators = load_generators(engine)
+    if reference_date is None:
+        reference_date = date.today() if seed is None else SEEDED_REFERENCE_DATE
+    if seed is not None:
+        random.seed(seed)  # Same dimension rows as a SQLite build with this seed
+
+    # Only the small dimension tables are ever inserted here
+    conn = sqlite3.connect(':memory:')
+    pool = make_pool(names, derive_seed(seed, 'dimensions'), DIMENSION_POOL_SIZE)
+    loader = FileTableLoader(conn, generators, output_dir, file_format, tables, workers, chunk_size, seed,
+                             compression)
+    ctx = BuildContext(conn, loader, generators, scaled_row_counts(scale_factor), reference_date, names, pool)
+    try:
+        with loader:  # Stops the workers also when a table fails
+            for spec in specs:
+                if spec.derived:
+                    continue
+                conn.execute(spec.ddl)
+                spec.build(ctx, spec.name)
+            return loader.finish()
+    finally:
+        conn.close()
+
+
+def _directory_mb(path):
+    return sum(os.path.getsize(os.path.join(root, name))
+               for root, _, files in os.walk(path) for name in files) / (1024 * 1024)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the fact tables straight to CSV or Parquet files")
+    parser.add_argument('--output-dir', default='files', help="directory the table folders are written to")
+    parser.add_argument('--format', choices=list(FILE_FORMATS), default='csv', dest='file_format',
+                        help="file format of every table")
+    parser.add_argument('--table', action='append', choices=FILE_TABLES,
+                        help="table to write (repeatable, default: all four)")
+    parser.add_argument('--profile', choices=['enhanced', 'stdlib'], default='enhanced',
+                        help="name source, as for enhanced_database_setup.py")
+    parser.add_argument('--scale-factor', type=positive_float, default=1,
+                        help="multiply the table sizes (1 = ~45k sales rows, 100 = ~4.5M)")
+    parser.add_argument('--engine', choices=GENERATION_ENGINES, default='python',
+                        help="fact table generator: row-at-a-time Python or vectorized NumPy")
+    parser.add_argument('--workers', type=positive_int, default=1,
+                        help="write the tables and sales months in this many worker processes")
+    parser.add_argument('--seed', type=int, help="seed for files that match a seeded database build")
+    parser.add_argument('--reference-date', type=iso_date,
+                        help=f"date the data ends on (default: today, {SEEDED_REFERENCE_DATE} with --seed)")
+    parser.add_argument('--chunk-size', type=positive_int, default=DEFAULT_CHUNK_SIZE,
+                        help="rows written per batch (one Parquet row group)")
+    parser.add_argument('--compression', choices=COMPRESSIONS, default='snappy',
+                        help="Parquet compression codec")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🗂️  DIRECT FILE GENERATION")
+    print("="*70)
+    start = time.perf_counter()
+    results = generate_files(args.output_dir, args.file_format, args.table or FILE_TABLES,
+                             args.scale_factor, args.engine, args.workers, args.seed, args.reference_date,
+                             args.chunk_size, args.compression, args.profile)
+    elapsed = time.perf_counter() - start
+
+    print(f"\n🗂️  {args.file_format} files in {args.output_dir}")
+    print("   Table                        |      Rows | Files |    MB")
+    print("   -----------------------------|-----------|-------|------")
+    for table, (rows, files) in results.items():
+        size_mb = _directory_mb(os.path.join(args.output_dir, table))
+        print(f"   {table:28} | {rows:9,} | {files:5} | {size_mb:5.1f}")
+    total_rows = sum(rows for rows, _ in results.values())
+    print(f"\n✅ Wrote {total_rows:,} rows in {elapsed:.2f}s ({total_rows / elapsed:,.0f} rows/s)")
@@ -0,0 +1,196 @@
+"""
+EPAM Practice Database - Incremental Append
+Grow an existing practice database by N days instead of rebuilding it.
+
+append_days() continues sales, orders/order_items and financial_transactions
+from the day after each table's own newest date and from its highest ID, at
+the average daily volume the table already has. All of them run up to the
+same end date, N days after the newest date in the database, so a table that
+stopped earlier than the others is backfilled instead of keeping a hole. The new rows go into the
+existing, indexed tables in a single transaction, together with an
+incremental refresh of the sales summary tables, and afterwards only the
+touched tables are re-analyzed with a bounded PRAGMA analysis_limit, so the
+cost of extending a large benchmark database depends on N, not on its size.
+"""
+
+import time
+from datetime import date, timedelta
+from db_connection import connect
+from partitioned_sales import ensure_partitions, is_partitioned, partitions_between
+from python_generators import derive_seed
+from sales_summaries import refresh_summaries
+from table_loaders import DEFAULT_CHUNK_SIZE, insert_in_chunks
+
+# (table, date column) of every table that grows with time
+APPENDED_TABLES = [
+    ('orders', 'order_date'),
+    ('order_items', None),
+    ('sales', 'sale_date'),
+    ('financial_transactions', 'transaction_date'),
+]
+
+# Rows sampled per index when the touched tables are re-analyzed
+ANALYSIS_LIMIT = 1000
+
+
+def _scalar(conn, sql):
+    return conn.execute(sql).fetchone()[0]
+
+
+def _column_count(conn, table):
+    return len(conn.execute(f"PRAGMA table_info({table})").fetchall())
+
+
+def daily_volume(conn, table, date_column):
+    """Average rows per calendar day already in table (at least 1)"""
+    count, days = conn.execute(
+        f"SELECT COUNT(*), julianday(MAX({date_column})) - julianday(MIN({date_column})) + 1 FROM {table}"
+    ).fetchone()
+    if not count:
+        return 1
+    return max(1, round(count / days))
+
+
+def last_dates(conn):
+    """{table: newest date} of the dated appended tables"""
+    newest = {
+        table: _scalar(conn, f"SELECT MAX({date_column}) FROM {table}")
+        for table, date_column in APPENDED_TABLES if date_column
+    }
+    if None in newest.values():
+        empty = ', '.join(table for table, value in newest.items() if value is None)
+        raise ValueError(f"no dated rows to continue in {empty}; run the setup first")
+    return {table: date.fromisoformat(value[:10]) for table, value in newest.items()}
+
+
+def last_date(conn):
+    """Newest date in any of the appended tables"""
+    return max(last_dates(conn).values())
+
+
+def append_range(conn, days):
+    """({table: first appended day}, shared end date) of a `days`-day append"""
+    newest = last_dates(conn)
+    end_date = max(newest.values()) + timedelta(days=days)
+    return {table: last + timedelta(days=1) for table, last in newest.items()}, end_date
+
+
+def test_date_gaps(db_path, table='sales', date_column='sale_date'):
+    """Days between the oldest and newest row of table that have no rows
+
+    Every seeded day has sales, so any missing day is a hole left by an
+    append. Prints the result and returns the missing dates.
+    """
+    conn = connect(db_path)
+    try:
+        dates = [date.fromisoformat(value) for (value,) in conn.execute(
+            f"SELECT DISTINCT substr({date_column}, 1, 10) FROM {table} ORDER BY 1"
+        )]
+    finally:
+        conn.close()
+    missing = [
+        earlier + timedelta(days=offset)
+        for earlier, later in zip(dates, dates[1:])
+        for offset in range(1, (later - earlier).days)
+    ]
+    if missing:
+        print(f"❌ {table} has no rows on {len(missing)} days, {missing[0]} .. {missing[-1]}")
+    else:
+        print(f"✅ {table} has rows on every day from {dates[0]} to {dates[-1]}" if dates else f"✅ {table} is empty")
+    return missing
+
+
+def append_days(conn, days, generators, names='faker', seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Append `days` more days of fact rows to an existing database
+
+    generators is python_generators or numpy_generators. Returns
+    {table: rows appended}, including the summary rows that were rewritten.
+    """
+    if days < 1:
+        raise ValueError("days must be at least 1")
+
+    first_days, end_date = append_range(conn, days)
+    table_days = {table: (end_date - first_day).days + 1 for table, first_day in first_days.items()}
+    per_day = {table: daily_volume(conn, table, column) for table, column in APPENDED_TABLES if column}
+
+    first_order_id = _scalar(conn, "SELECT COALESCE(MAX(order_id), 0) + 1 FROM orders")
+    first_item_id = _scalar(conn, "SELECT COALESCE(MAX(order_item_id), 0) + 1 FROM order_items")
+    first_sale_id = _scalar(conn, "SELECT COALESCE(MAX(sale_id), 0) + 1 FROM sales")
+    first_transaction_id = _scalar(conn, "SELECT COALESCE(MAX(transaction_id), 0) + 1 FROM financial_transactions")
+    num_customers = _scalar(conn, "SELECT MAX(customer_id) FROM customers")
+    product_prices = dict(conn.execute("SELECT product_id, price FROM products"))
+    rep_commission_rates = dict(conn.execute("SELECT rep_id, commission_rate FROM sales_reps"))
+
+    def table_seed(table):
+        # Keyed by the first appended day so repeated appends draw fresh rows
+        return derive_seed(seed, 'append', table, first_days.get(table, first_days['orders']).isoformat())
+
+    def insert(table, rows):
+        insert_sql = f"INSERT INTO {table} VALUES ({', '.join('?' * _column_count(conn, table))})"
+        return insert_in_chunks(conn, insert_sql, rows, chunk_size, commit_every=None)
+
+    num_orders = per_day['orders'] * table_days['orders']
+    num_sales = per_day['sales'] * table_days['sales']
+    num_transactions = per_day['financial_transactions'] * table_days['financial_transactions']
+    appended = {}
+
+    # One transaction for everything: the database either grows by whole days or not at all
+    appended['orders'] = insert('orders', generators.generate_orders(
+        num_orders, num_customers, end_date, names, seed=table_seed('orders'),
+        first_order_id=first_order_id, days_back=table_days['orders'] - 1
+    ))
+    appended['order_items'] = insert('order_items', generators.generate_order_items(
+        num_orders, product_prices, seed=table_seed('order_items'),
+        first_order_id=first_order_id, first_item_id=first_item_id
+    ))
+
+    # generate_sales_partition counts its days from reference_date - 365
+    sales_reference_date = first_days['sales'] + timedelta(days=365)
+    if is_partitioned(conn):
+        ensure_partitions(conn, first_days['sales'], end_date)  # The view's trigger rejects months without a table
+    appended['sales'] = 0
+    for partition in generators.sales_partitions(num_sales, table_seed('sales'), table_days['sales'], first_sale_id):
+        appended['sales'] += insert('sales', generators.generate_sales_partition(
+            *partition, rep_commission_rates, len(product_prices), sales_reference_date,
+            seed=derive_seed(table_seed('sales'), partition[0])
+        ))
+
+    appended['financial_transactions'] = insert('financial_transactions', generators.generate_financial_transactions(
+        num_transactions, end_date, seed=table_seed('financial_transactions'),
+        first_transaction_id=first_transaction_id, days_back=table_days['financial_transactions'] - 1
+    ))
+    summaries = refresh_summaries(conn)
+    conn.commit()
+
+    # Refresh the planner statistics of the touched tables only, from a
+    # bounded sample, instead of a full ANALYZE of the whole database
+    conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+    for table, _ in APPENDED_TABLES:
+        if table == 'sales' and is_partitioned(conn):
+            for partition in partitions_between(conn, first_days['sales'].isoformat(), end_date.isoformat()):
+                conn.execute(f"ANALYZE {partition}")
+        else:
+            conn.execute(f"ANALYZE {table}")
+    conn.commit()
+    appended.update(summaries)
+    return appended
+
+
+def print_append_summary(appended, first_day, end_date, elapsed):
+    """Console summary of an append run"""
+    print(f"➕ Appended {first_day} .. {end_date} in {elapsed:.2f}s:")
+    for table, count in appended.items():
+        print(f"   {table}: {count:,} rows")
+
+
+def run_append(db_path, days, generators, names='faker', seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Open db_path, append `days` days and print what was added"""
+    conn = connect(db_path)
+    try:
+        first_days, end_date = append_range(conn, days)
+        start = time.perf_counter()
+        appended = append_days(conn, days, generators, names, seed, chunk_size)
+        print_append_summary(appended, min(first_days.values()), end_date, time.perf_counter() - start)
+    finally:
+        conn.close()
+    return appended
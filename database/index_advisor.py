@@ -0,0 +1,332 @@
+"""
+EPAM Practice Database - Index Advisor
+Measures which indexes a query workload actually needs.
+
+The workload (the sample queries of test_enhanced_database, the runnable
+course queries and optionally a recorded .sql file) is replayed on a scratch
+copy of the database, never on the original. Every existing index is dropped
+in turn to see how much slower the workload gets without it, and every
+candidate index (foreign-key columns without an index, composite versions of
+the single-column foreign-key indexes, and --candidate extras) is created in
+turn to see how much faster it gets. Only the queries whose EXPLAIN QUERY PLAN
+changes are timed, so unrelated queries add no noise. Each index is weighed against its cost:
+the time to build it, the space it takes and the extra time it adds to every
+inserted row. The result is a recommended index set, written as CREATE INDEX
+statements. Existing indexes on tables no workload query touches were never
+measured; they stay in the file as "kept, not evaluated", so only indexes
+that were measured and found useless are left out.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from db_connection import DEFAULT_DB_PATH, connect
+from query_plans import explainable_sql, plan_tree
+from sql_benchmark import MODULE_GLOBS, REPO_DIR, extract_sql_blocks, is_read_only, split_statements
+
+# An index is worth keeping or adding when the workload runs at least this
+# much faster with it, in total and relative to the queries it touches
+MIN_SAVED_MS = 1.0
+MIN_SPEEDUP = 1.10
+# Timed runs per query; the median counts
+DEFAULT_REPEAT = 5
+# Rows inserted (and rolled back) to measure the write cost of an index
+WRITE_PROBE_ROWS = 2000
+
+
+def load_workload(conn, sql_files=(), include_course=True):
+    """[(label, sql, params)] of the read-only statements that run on this database"""
+    from enhanced_database_setup import SAMPLE_PARAMS, SAMPLE_QUERIES
+    candidates = [(f'test_enhanced_database:{name}', sql, SAMPLE_PARAMS) for name, sql in SAMPLE_QUERIES.items()]
+
+    paths = []
+    if include_course:
+        paths = sorted(path for pattern in MODULE_GLOBS for path in glob.glob(os.path.join(REPO_DIR, pattern)))
+    for block in extract_sql_blocks(paths):
+        statements = split_statements(block['sql'])
+        if is_read_only(statements):
+            candidates += [(f"{block['id']}#{n}", sql, ()) for n, sql in enumerate(statements, start=1)]
+
+    for path in sql_files:
+        with open(path, encoding='utf-8') as f:
+            statements = split_statements(f.read())
+        candidates += [(f'{path}#{n}', sql, ()) for n, sql in enumerate(statements, start=1)
+                       if is_read_only([sql])]
+
+    workload = []
+    for label, sql, params in candidates:
+        sql = explainable_sql(sql)  # replay EXPLAIN examples as the query they explain
+        try:
+            conn.execute(sql, params).fetchall()
+        except sqlite3.Error:
+            continue  # other dialect or a table this database does not have
+        workload.append((label, sql, params))
+    return workload
+
+
+def time_queries(conn, workload, repeat=DEFAULT_REPEAT):
+    """Median-of-repeat wall time in ms of every workload query
+
+    The median, unlike the fastest run, does not swing with one lucky or
+    cold run, so the verdict on an index near the thresholds is repeatable.
+    """
+    timings = []
+    for _, sql, params in workload:
+        runs = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            conn.execute(sql, params).fetchall()
+            runs.append((time.perf_counter() - start) * 1000)
+        timings.append(statistics.median(runs))
+    return timings
+
+
+def existing_indexes(conn):
+    """{index name: (table, CREATE INDEX sql)} of the explicitly created indexes"""
+    return {
+        name: (table, sql) for name, table, sql in conn.execute(
+            "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY name"
+        )
+    }
+
+
+def _indexed_columns(conn, table):
+    """Column lists of the table's indexes (the primary key counts as ('rowid',))"""
+    columns = [('rowid',)]
+    for _, name, *_ in conn.execute(f"PRAGMA index_list({table})"):
+        columns.append(tuple(row[2] for row in conn.execute(f"PRAGMA index_info({name})")))
+    return columns
+
+
+def candidate_indexes(conn, extra=()):
+    """{index name: (table, CREATE INDEX sql)} of the indexes worth trying"""
+    candidates = {}
+
+    def add(table, columns):
+        if any(existing[:len(columns)] == tuple(columns) for existing in _indexed_columns(conn, table)):
+            return  # already covered by the leading columns of an index
+        name = f"idx_advisor_{table}_{'_'.join(columns)}"
+        candidates[name] = (table, f"CREATE INDEX {name} ON {table}({', '.join(columns)})")
+
+    tables = [row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )]
+    for table in tables:
+        foreign_keys = [row[3] for row in conn.execute(f"PRAGMA foreign_key_list({table})")]
+        indexed = _indexed_columns(conn, table)
+        for column in foreign_keys:
+            add(table, [column])
+            # Composite versions of single-column foreign-key indexes
+            if (column,) in indexed:
+                for other in foreign_keys:
+                    if other != column:
+                        add(table, [column, other])
+
+    for spec in extra:
+        match = re.fullmatch(r'\s*(\w+)\s*\(([\w\s,]+)\)\s*', spec)
+        if not match:
+            raise ValueError(f"candidate must look like table(column, ...), got {spec!r}")
+        add(match.group(1), [column.strip() for column in match.group(2).split(',')])
+    return candidates
+
+
+def index_size_kb(conn, name):
+    """Size of an index on disk"""
+    try:
+        pages = conn.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = ?", (name,)).fetchone()[0]
+        return round((pages or 0) / 1024, 1)
+    except sqlite3.OperationalError:
+        return None  # SQLite built without the dbstat virtual table
+
+
+def insert_cost_us(conn, table, rows=WRITE_PROBE_ROWS):
+    """Microseconds per row to insert copies of existing rows (rolled back)"""
+    columns = [(name, declared_type.upper(), pk) for _, name, declared_type, _, _, pk
+               in conn.execute(f"PRAGMA table_info({table})")]
+    unique = {
+        info[2]
+        for _, name, is_unique, *_ in conn.execute(f"PRAGMA index_list({table})") if is_unique
+        for info in conn.execute(f"PRAGMA index_info({name})")
+    }
+    # A primary key column without an index of its own is the rowid: NULL
+    # gives the copies new ones. Key columns of composite and WITHOUT ROWID
+    # keys have one, like UNIQUE columns: integers are shifted past their
+    # maximum, other values get a suffix
+    def copied(name, declared_type, pk):
+        if pk and name not in unique:
+            return 'NULL'
+        if name not in unique:
+            return name
+        if declared_type == 'INTEGER':
+            return f"{name} + (SELECT MAX({name}) FROM {table}) + 1"
+        return f"{name} || '~'"
+
+    select = ', '.join(copied(*column) for column in columns)
+    conn.execute("BEGIN")
+    start = time.perf_counter()
+    conn.execute(f"INSERT INTO {table} SELECT {select} FROM {table} LIMIT {rows}")
+    elapsed = time.perf_counter() - start
+    conn.execute("ROLLBACK")
+    return elapsed * 1e6 / rows
+
+
+def _touches(sql, table):
+    return re.search(rf'\b{re.escape(table)}\b', sql, re.IGNORECASE) is not None
+
+
+def _plans(conn, queries):
+    return [plan_tree(conn, sql, params) for _, sql, params in queries]
+
+
+def evaluate(conn, workload, name, table, sql, exists, repeat=DEFAULT_REPEAT):
+    """Workload time with and without one index, plus its build, space and write cost
+
+    Only queries whose plan changes with the index are timed; for every
+    other query the index makes no difference, and timing it would just add noise.
+    """
+    affected = [query for query in workload if _touches(query[1], table)]
+
+    def toggle():
+        start = time.perf_counter()
+        conn.execute(f"DROP INDEX {name}" if index_present else sql)
+        return (time.perf_counter() - start) * 1000
+
+    index_present = exists
+    plans_before = _plans(conn, affected)
+    write_before = insert_cost_us(conn, table)
+    size_kb = index_size_kb(conn, name) if exists else None
+    build_ms = toggle()
+    index_present = not index_present
+    if size_kb is None:
+        size_kb = index_size_kb(conn, name)
+    changed = [query for query, plan in zip(affected, plans_before) if plan_tree(conn, query[1], query[2]) != plan]
+    ms_after = sum(time_queries(conn, changed, repeat))
+    write_after = insert_cost_us(conn, table)
+
+    # Back to the original state (and time the build when the index was dropped)
+    rebuild_ms = toggle()
+    index_present = not index_present
+    ms_before = sum(time_queries(conn, changed, repeat))
+    conn.commit()
+
+    if exists:
+        with_ms, without_ms, with_write, without_write = ms_before, ms_after, write_before, write_after
+        build_ms = rebuild_ms
+    else:
+        with_ms, without_ms, with_write, without_write = ms_after, ms_before, write_after, write_before
+
+    saved_ms = without_ms - with_ms
+    speedup = without_ms / with_ms if with_ms else 1.0
+    return {
+        'index': name,
+        'table': table,
+        'sql': sql,
+        'existing': exists,
+        'queries': len(affected),
+        'plan_changes': len(changed),
+        'without_ms': round(without_ms, 3),
+        'with_ms': round(with_ms, 3),
+        'saved_ms': round(saved_ms, 3),
+        'speedup': round(speedup, 2),
+        'build_ms': round(build_ms, 2),
+        'size_kb': size_kb,
+        'write_us_per_row': round(max(0.0, with_write - without_write), 2),
+        'recommended': saved_ms >= MIN_SAVED_MS and speedup >= MIN_SPEEDUP,
+    }
+
+
+def advise(db_path, sql_files=(), extra_candidates=(), include_course=True, repeat=DEFAULT_REPEAT):
+    """Evaluate every existing and candidate index on a scratch copy of db_path"""
+    scratch_dir = tempfile.mkdtemp(prefix='epam_advisor_')
+    scratch_path = os.path.join(scratch_dir, 'scratch.db')
+    source = connect(db_path, read_only=True)
+    # No statement cache: a cached EXPLAIN keeps showing the plan from before an index change
+    conn = sqlite3.connect(scratch_path, isolation_level=None, cached_statements=0)
+    try:
+        source.backup(conn)
+        source.close()
+        workload = load_workload(conn, sql_files, include_course)
+        baseline_ms = sum(time_queries(conn, workload, repeat))
+        results = [
+            evaluate(conn, workload, name, table, sql, True, repeat)
+            for name, (table, sql) in existing_indexes(conn).items()
+        ] + [
+            evaluate(conn, workload, name, table, sql, False, repeat)
+            for name, (table, sql) in candidate_indexes(conn, extra_candidates).items()
+        ]
+    finally:
+        conn.close()
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    return {'queries': len(workload), 'baseline_ms': round(baseline_ms, 3), 'indexes': results}
+
+
+def print_advice(report):
+    """Console table of the evaluated indexes"""
+    print(f"\n📋 Workload: {report['queries']} queries, {report['baseline_ms']:.1f} ms with the current indexes")
+    print("   Index                                     | Now | Plans changed | Saved ms | Speedup | Build ms |  Size KB | Write us/row | Keep")
+    print("   ------------------------------------------|-----|---------------|----------|---------|----------|----------|--------------|-----")
+    for result in sorted(report['indexes'], key=lambda r: r['saved_ms'], reverse=True):
+        size = f"{result['size_kb']:8.1f}" if result['size_kb'] is not None else "       ?"
+        print(f"   {result['index'][:41]:41} | {'yes' if result['existing'] else ' no'} | "
+              f"{result['plan_changes']:5} of {result['queries']:5} | {result['saved_ms']:8.2f} | {result['speedup']:6.2f}x | "
+              f"{result['build_ms']:8.2f} | {size} | {result['write_us_per_row']:12.2f} | "
+              f"{'✅' if result['recommended'] else '❌'}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recommend an index set from a replayed query workload")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to analyze (only a scratch copy is changed)")
+    parser.add_argument('--workload', action='append', default=[],
+                        help="extra .sql file of recorded queries (repeatable)")
+    parser.add_argument('--no-course-queries', action='store_true',
+                        help="leave the 01_SQL course queries out of the workload")
+    parser.add_argument('--candidate', action='append', default=[],
+                        help="extra candidate index such as 'sales(product_id, sale_date)' (repeatable)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="runs per query; the median is used")
+    parser.add_argument('--json', help="write the full report to this JSON file")
+    parser.add_argument('--output', default='recommended_indexes.sql',
+                        help="where to write the recommended (and not evaluated) CREATE INDEX statements")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🔧 INDEX ADVISOR")
+    print("="*70)
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found; run enhanced_database_setup.py first")
+
+    report = advise(args.db, args.workload, args.candidate, not args.no_course_queries, args.repeat)
+    print_advice(report)
+
+    recommended = [result for result in report['indexes'] if result['recommended']]
+    dropped = [result['index'] for result in report['indexes']
+               if result['existing'] and not result['recommended'] and result['queries']]
+    unused = [result['index'] for result in report['indexes'] if result['existing'] and not result['queries']]
+    not_evaluated = [result for result in report['indexes'] if result['existing'] and not result['queries']]
+    with open(args.output, 'w') as f:
+        f.write(f"-- Recommended indexes for a workload of {report['queries']} queries\n")
+        for result in sorted(recommended, key=lambda r: (r['table'], r['index'])):
+            f.write(f"{result['sql']};  -- saves {result['saved_ms']:.1f} ms ({result['speedup']:.2f}x)\n")
+        # Nothing was measured for these, so applying the file must not lose them
+        if not_evaluated:
+            f.write("\n-- Kept, not evaluated: no workload query touches their table\n")
+            for result in sorted(not_evaluated, key=lambda r: (r['table'], r['index'])):
+                f.write(f"{result['sql']};\n")
+        if dropped:
+            f.write(f"\n-- Measured without benefit, left out: {', '.join(sorted(dropped))}\n")
+    print(f"\n💾 {len(recommended)} recommended and {len(not_evaluated)} not evaluated indexes "
+          f"written to {args.output}")
+    if dropped:
+        print(f"🗑️  No measurable benefit for this workload: {', '.join(dropped)}")
+    if unused:
+        print(f"💤 Not exercised by the workload (kept as they are): {', '.join(unused)}")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {args.json}")
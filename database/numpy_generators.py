@@ -0,0 +1,237 @@
+"""
+EPAM Practice Database - NumPy Fact Table Generators
+Vectorized drop-in replacement for python_generators.py.
+
+Each table is built as column arrays, one batch of rows at a time: every
+random column is a single NumPy draw for the whole batch (weighted status
+choices, debit/credit splits, commission math, reference numbers), and the
+batch is handed to executemany() as tuples. Only one batch is held in memory,
+so the generators stay cheap even at scale factors with millions of rows.
+
+The value distributions match python_generators.py; the exact rows differ
+because the random streams differ. Seeding, sales partitioning and the
+FakerPool for names and addresses follow the same rules as python_generators.py.
+"""
+
+from datetime import timedelta
+
+import numpy as np
+
+from faker_pool import POOL_SIZE
+from python_generators import (
+    ITEMS_PER_ORDER, SALES_DAYS, SALES_PARTITION_DAYS, ORDER_STATUSES, ORDER_STATUS_WEIGHTS,
+    PAYMENT_METHODS, TRANSACTION_DESCRIPTIONS, MOVEMENT_TYPES, CUSTOMER_SEGMENTS, CITIES, STATES,
+    NUM_WAREHOUSES, NUM_TERRITORIES, NUM_ACCOUNTS, derive_seed, make_pool
+)
+
+BATCH_SIZE = 100_000
+
+
+def _batches(total, batch_size):
+    """Yield (start, stop) offsets covering range(total) in batch_size steps"""
+    for start in range(0, total, batch_size):
+        yield start, min(start + batch_size, total)
+
+
+def _rows(*columns):
+    """Turn equal-length column arrays into tuples of plain Python values"""
+    return zip(*(column.tolist() for column in columns))
+
+
+def _concat(*parts):
+    """Element-wise string concatenation of arrays and scalars"""
+    result = parts[0]
+    for part in parts[1:]:
+        result = np.char.add(result, part)
+    return result
+
+
+def _dates_back(rng, reference_date, days_back, size):
+    """ISO date strings uniformly drawn from the days_back days up to reference_date"""
+    end = np.datetime64(reference_date, 'D')
+    return (end - rng.integers(0, days_back + 1, size)).astype(str)
+
+
+def items_per_order(num_orders, rng):
+    """Shuffled 1-5 item counts whose total only depends on the number of orders"""
+    return rng.permutation(np.resize(np.array(ITEMS_PER_ORDER, dtype=np.int64), num_orders))
+
+
+def daily_sales_counts(total_sales, rng, days=SALES_DAYS):
+    """Spread exactly total_sales over the given days with a 50-200 per day shape"""
+    weights = rng.integers(50, 201, days)
+    counts = total_sales * weights // weights.sum()
+    counts[np.arange(total_sales - counts.sum()) % days] += 1
+    return counts
+
+
+def sales_partitions(num_sales, seed=None, days=SALES_DAYS, first_sale_id=1):
+    """Split the sales days into monthly (first_day, day_counts, first_sale_id) partitions"""
+    day_counts = daily_sales_counts(num_sales, np.random.default_rng(seed), days)
+    partitions = []
+
+    for first_day in range(0, days, SALES_PARTITION_DAYS):
+        counts = day_counts[first_day:first_day + SALES_PARTITION_DAYS]
+        partitions.append((first_day, counts, first_sale_id))
+        first_sale_id += int(counts.sum())
+
+    return partitions
+
+
+def generate_customers(num_customers, reference_date, names='faker', seed=None, batch_size=BATCH_SIZE):
+    """Generate realistic customer profiles in vectorized batches"""
+    rng = np.random.default_rng(seed)
+    pool = make_pool(names, seed, min(POOL_SIZE, num_customers))
+
+    for start, stop in _batches(num_customers, batch_size):
+        size = stop - start
+        customer_id = np.arange(start + 1, stop + 1)
+        first_name = pool.take(rng, 'first_name', size)
+        last_name = pool.take(rng, 'last_name', size)
+        email = _concat(np.char.lower(first_name), '.', np.char.lower(last_name),
+                        customer_id.astype(str), '@email.com')  # Unique at any scale
+        phone = pool.take(rng, 'phone_number', size).astype('<U15')  # Truncated to 15 chars
+        dob = _dates_back(rng, reference_date - timedelta(days=18 * 365), 62 * 365, size)
+        reg_date = _dates_back(rng, reference_date, 3 * 365, size)
+        city = rng.choice(CITIES, size)
+        state = rng.choice(STATES, size)
+        country = np.full(size, 'USA')
+        segment = rng.choice(CUSTOMER_SEGMENTS, size)
+        is_vip = (rng.random(size) < 0.15).astype(np.int64)  # 15% VIP
+        total_spent = np.round(rng.uniform(0, 1, size) * np.where(is_vip, 5000, 1000), 2)
+
+        yield from _rows(customer_id, first_name, last_name, email, phone, dob, reg_date,
+                         city, state, country, segment, is_vip, total_spent)
+
+
+def generate_orders(num_orders, num_customers, reference_date, names='faker', seed=None,
+                    first_order_id=1, days_back=365, batch_size=BATCH_SIZE):
+    """Generate realistic order rows in vectorized batches"""
+    rng = np.random.default_rng(seed)
+    pool = make_pool(names, seed, min(POOL_SIZE, num_orders))
+    status_p = np.array(ORDER_STATUS_WEIGHTS) / sum(ORDER_STATUS_WEIGHTS)
+
+    for start, stop in _batches(num_orders, batch_size):
+        size = stop - start
+        order_id = np.arange(first_order_id + start, first_order_id + stop)
+        customer_id = rng.integers(1, num_customers + 1, size)
+        order_date = _dates_back(rng, reference_date, days_back, size)
+        status = rng.choice(ORDER_STATUSES, size, p=status_p)
+        shipping_address = pool.take(rng, 'address', size)
+        billing_address = np.where(rng.random(size) > 0.3, shipping_address,
+                                   pool.take(rng, 'address', size))
+        payment_method = rng.choice(PAYMENT_METHODS, size)
+        subtotal = np.round(rng.uniform(25, 1500, size), 2)
+        tax_amount = np.round(subtotal * 0.08, 2)  # 8% tax
+        shipping_cost = np.where(subtotal < 50, np.round(rng.uniform(0, 25, size), 2), 0.0)
+        total_amount = subtotal + tax_amount + shipping_cost
+        warehouse_id = rng.integers(1, NUM_WAREHOUSES + 1, size)
+
+        yield from _rows(order_id, customer_id, order_date, status, shipping_address,
+                         billing_address, payment_method, subtotal, tax_amount,
+                         shipping_cost, total_amount, warehouse_id)
+
+
+def generate_order_items(num_orders, product_prices, seed=None, first_order_id=1, first_item_id=1,
+                         batch_size=BATCH_SIZE):
+    """Generate 1-5 line items per order, priced from product_prices (product_id -> price)"""
+    rng = np.random.default_rng(seed)
+    num_products = len(product_prices)
+    price_lookup = np.zeros(num_products + 1)
+    price_lookup[list(product_prices)] = list(product_prices.values())
+
+    item_counts = items_per_order(num_orders, rng)
+    first_item_ids = first_item_id + np.concatenate(([0], np.cumsum(item_counts)[:-1]))
+
+    # Batch by orders so every order keeps all of its items together
+    for start, stop in _batches(num_orders, batch_size):
+        counts = item_counts[start:stop]
+        size = int(counts.sum())
+        order_item_id = np.arange(first_item_ids[start], first_item_ids[start] + size)
+        order_id = np.repeat(np.arange(first_order_id + start, first_order_id + stop), counts)
+        product_id = rng.integers(1, num_products + 1, size)
+        quantity = rng.integers(1, 4, size)
+        unit_price = price_lookup[product_id]
+        total_price = unit_price * quantity
+
+        yield from _rows(order_item_id, order_id, product_id, quantity, unit_price, total_price)
+
+
+def generate_sales_partition(first_day, day_counts, first_sale_id, rep_commission_rates,
+                             num_products, reference_date, seed=None, batch_size=BATCH_SIZE):
+    """Generate the sales of one partition (see sales_partitions)"""
+    rng = np.random.default_rng(seed)
+    num_reps = len(rep_commission_rates)
+    rate_lookup = np.zeros(num_reps + 1)
+    rate_lookup[list(rep_commission_rates)] = list(rep_commission_rates.values())
+
+    start_date = np.datetime64(reference_date - timedelta(days=365), 'D') + first_day
+    day_counts = np.asarray(day_counts)
+    day_ends = np.cumsum(day_counts)
+
+    for start, stop in _batches(int(day_counts.sum()), batch_size):
+        size = stop - start
+        sale_id = np.arange(first_sale_id + start, first_sale_id + stop)
+        # Row i belongs to the first day whose running total exceeds i
+        day = np.searchsorted(day_ends, np.arange(start, stop), side='right')
+        sale_date = (start_date + day).astype(str)
+        rep_id = rng.integers(1, num_reps + 1, size)
+        territory_id = rng.integers(1, NUM_TERRITORIES + 1, size)
+        product_id = rng.integers(1, num_products + 1, size)
+        quantity = rng.integers(1, 11, size)
+        unit_price = np.round(rng.uniform(25, 500, size), 2)
+        total_amount = unit_price * quantity
+        commission_earned = np.round(total_amount * rate_lookup[rep_id], 2)
+
+        yield from _rows(sale_id, rep_id, territory_id, sale_date, product_id,
+                         quantity, unit_price, total_amount, commission_earned)
+
+
+def generate_sales(num_sales, rep_commission_rates, num_products, reference_date, seed=None):
+    """Generate daily sales for the past 12 months (rep_commission_rates: rep_id -> rate)"""
+    for index, partition in enumerate(sales_partitions(num_sales, seed)):
+        yield from generate_sales_partition(*partition, rep_commission_rates, num_products,
+                                            reference_date, seed=derive_seed(seed, index))
+
+
+def generate_financial_transactions(num_transactions, reference_date, seed=None,
+                                    first_transaction_id=1, days_back=365, batch_size=BATCH_SIZE):
+    """Generate debit/credit ledger entries for the past year"""
+    rng = np.random.default_rng(seed)
+
+    for start, stop in _batches(num_transactions, batch_size):
+        size = stop - start
+        transaction_id = np.arange(first_transaction_id + start, first_transaction_id + stop)
+        account_id = rng.integers(1, NUM_ACCOUNTS + 1, size)
+        transaction_date = _dates_back(rng, reference_date, days_back, size)
+        description = rng.choice(TRANSACTION_DESCRIPTIONS, size)
+
+        # Half debits, half credits: one amount draw, split by a boolean mask
+        amount = np.round(rng.uniform(100, 50000, size), 2)
+        is_debit = rng.random(size) > 0.5
+        debit_amount = np.where(is_debit, amount, 0.0)
+        credit_amount = np.where(is_debit, 0.0, amount)
+
+        reference_number = _concat('REF', rng.integers(100000, 1000000, size).astype(str))
+
+        yield from _rows(transaction_id, account_id, transaction_date, description,
+                         debit_amount, credit_amount, reference_number)
+
+
+def generate_inventory_movements(num_movements, num_products, reference_date, seed=None,
+                                 batch_size=BATCH_SIZE):
+    """Generate stock movements for the past 6 months"""
+    rng = np.random.default_rng(seed)
+
+    for start, stop in _batches(num_movements, batch_size):
+        size = stop - start
+        movement_id = np.arange(start + 1, stop + 1)
+        product_id = rng.integers(1, num_products + 1, size)
+        warehouse_id = rng.integers(1, NUM_WAREHOUSES + 1, size)
+        movement_type = rng.choice(MOVEMENT_TYPES, size)
+        quantity = rng.integers(1, 101, size)
+        movement_date = _dates_back(rng, reference_date, 182, size)
+        reference_number = _concat('MOV', rng.integers(10000, 100000, size).astype(str))
+
+        yield from _rows(movement_id, product_id, warehouse_id, movement_type,
+                         quantity, movement_date, reference_number)
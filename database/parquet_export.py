@@ -0,0 +1,226 @@
+"""
+EPAM Practice Database - Parquet Export
+Writes every table of the practice database to Parquet for the Pandas and
+File I/O modules.
+
+SQLite is a row store: reading one column of sales still reads every row.
+The export turns each table into a columnar Parquet dataset that pandas,
+pyarrow or DuckDB can read column by column. The big date-driven tables are
+split into one Hive-style partition per month, so a reader filtering on a
+month only opens that month's files:
+
+    export/sales/sale_month=2024-03/part-0.parquet
+    export/orders/order_month=2024-03/part-0.parquet
+    export/customers/part-0.parquet
+
+    pd.read_parquet('export/sales', columns=['rep_id', 'total_amount'],
+                    filters=[('sale_month', '=', '2024-03')])
+
+Rows are streamed out of SQLite batch_size at a time and written as
+row groups, so memory stays flat at any scale factor. pyarrow is an
+optional dependency, imported only when an export runs.
+"""
+
+import argparse
+import os
+import shutil
+import time
+from db_connection import DEFAULT_DB_PATH, connect, exists
+from full_text_search import FTS_TABLES
+from partitioned_sales import PARTITION_GLOB, SALES_TABLE, is_partitioned
+
+DEFAULT_BATCH_SIZE = 100_000
+COMPRESSIONS = ['snappy', 'zstd', 'gzip', 'none']
+
+# table -> date column whose month names the partition
+MONTHLY_PARTITIONS = {
+    'orders': 'order_date',
+    'sales': 'sale_date',
+    'financial_transactions': 'transaction_date',
+    'inventory_movements': 'movement_date',
+}
+# Partition value of rows whose date is NULL (the name Hive and pyarrow use)
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def load_pyarrow():
+    """Import pyarrow and pyarrow.parquet (optional dependency)"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("The Parquet export needs pyarrow: pip install pyarrow") from exc
+    return pyarrow, pyarrow.parquet
+
+
+def exported_tables(conn):
+    """Every regular table, without SQLite internals and the FTS index tables
+
+    Partitioned sales is exported through its view as one sales dataset.
+    """
+    names = [
+        name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' "
+            "AND sql NOT LIKE 'CREATE VIRTUAL TABLE%' AND name NOT GLOB ? ORDER BY name", (PARTITION_GLOB,)
+        )
+        if not any(name.startswith(f'{fts}_') for fts in FTS_TABLES)
+    ]
+    if is_partitioned(conn):
+        names = sorted(names + [SALES_TABLE])
+    return names
+
+
+def arrow_type(pa, declared_type):
+    """Arrow type for a declared SQLite column type
+
+    DECIMAL columns are stored by SQLite as REAL, so they become float64.
+    """
+    declared_type = declared_type.upper()
+    if declared_type == 'INTEGER':
+        return pa.int64()
+    if declared_type == 'BOOLEAN':
+        return pa.bool_()
+    if declared_type == 'DATE':
+        return pa.date32()
+    if declared_type.startswith(('DECIMAL', 'REAL', 'FLOAT', 'DOUBLE', 'NUMERIC')):
+        return pa.float64()
+    return pa.string()
+
+
+def table_columns(conn, table):
+    """[(column, declared type)] of a table"""
+    return [(name, declared_type)
+            for _, name, declared_type, _, _, _ in conn.execute(f'PRAGMA table_info("{table}")')]
+
+
+def arrow_schema(pa, columns):
+    """Arrow schema for [(column, declared type)]"""
+    return pa.schema([(name, arrow_type(pa, declared_type)) for name, declared_type in columns])
+
+
+def arrow_column(pa, values, arrow_type):
+    """Arrow array of one column of a batch of rows"""
+    if arrow_type == pa.date32():
+        # SQLite hands back dates as ISO text, the Python generators as datetime.date
+        first = next((value for value in values if value is not None), None)
+        if isinstance(first, str):
+            return pa.array(values, pa.string()).cast(arrow_type)
+    if arrow_type == pa.bool_():
+        return pa.array(values, pa.int64()).cast(arrow_type)  # stored as 0/1
+    try:
+        return pa.array(values, arrow_type)
+    except pa.ArrowTypeError:
+        if arrow_type != pa.string():
+            raise
+        # A column without a declared type can hold anything; keep it as text
+        return pa.array([value if value is None or isinstance(value, str) else str(value) for value in values],
+                        arrow_type)
+
+
+def write_parquet(pa, pq, batches, schema, path, compression):
+    """Write an iterable of row batches into one Parquet file, a row group per batch
+
+    Returns the rows written.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    rows = 0
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for batch in batches:
+            columns = list(zip(*batch))
+            writer.write_batch(pa.record_batch(
+                [arrow_column(pa, values, field.type) for values, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            rows += len(batch)
+    return rows
+
+
+def fetch_batches(cursor, batch_size):
+    """The rows of an executed cursor, batch_size at a time"""
+    return iter(lambda: cursor.fetchmany(batch_size), [])
+
+
+def partition_months(conn, table, date_column):
+    """Distinct YYYY-MM months of a table's date column (None for NULL dates)"""
+    return [month for (month,) in conn.execute(
+        f"SELECT DISTINCT substr({date_column}, 1, 7) FROM {table} ORDER BY 1"
+    )]
+
+
+def export_table(conn, table, output_dir, batch_size=DEFAULT_BATCH_SIZE, compression='snappy'):
+    """Write one table to output_dir/table; returns (rows, files)"""
+    pa, pq = load_pyarrow()
+    table_dir = os.path.join(output_dir, table)
+    # Months that no longer exist must not survive from an earlier export
+    shutil.rmtree(table_dir, ignore_errors=True)
+    columns = table_columns(conn, table)
+    schema = arrow_schema(pa, columns)
+    cursor = conn.cursor()
+
+    date_column = MONTHLY_PARTITIONS.get(table)
+    if date_column not in [name for name, _ in columns]:  # also the exercise tables of the same name
+        cursor.execute(f'SELECT * FROM "{table}"')
+        return write_parquet(pa, pq, fetch_batches(cursor, batch_size), schema,
+                             os.path.join(table_dir, 'part-0.parquet'), compression), 1
+
+    partition_column = date_column.replace('_date', '_month')
+    rows = files = 0
+    for month in partition_months(conn, table, date_column):
+        if month is None:
+            cursor.execute(f"SELECT * FROM {table} WHERE {date_column} IS NULL")
+        else:
+            # A range on the date column instead of substr() keeps its index usable
+            cursor.execute(f"SELECT * FROM {table} WHERE {date_column} >= ? AND {date_column} < ?",
+                           (f'{month}-01', f'{month}-32'))
+        path = os.path.join(table_dir, f'{partition_column}={month or NULL_PARTITION}', 'part-0.parquet')
+        rows += write_parquet(pa, pq, fetch_batches(cursor, batch_size), schema, path, compression)
+        files += 1
+    return rows, files
+
+
+def export_database(db_path=DEFAULT_DB_PATH, output_dir='parquet', tables=None,
+                    batch_size=DEFAULT_BATCH_SIZE, compression='snappy'):
+    """Export tables (default: all) to Parquet; returns {table: (rows, files, seconds)}"""
+    load_pyarrow()
+    compression = None if compression == 'none' else compression
+    conn = connect(db_path, read_only=True)
+    results = {}
+    try:
+        for table in tables or exported_tables(conn):
+            start = time.perf_counter()
+            rows, files = export_table(conn, table, output_dir, batch_size, compression)
+            results[table] = (rows, files, time.perf_counter() - start)
+    finally:
+        conn.close()
+    return results
+
+
+def print_export_summary(results, output_dir):
+    """Rows, files and throughput per exported table"""
+    print(f"\n📦 Parquet export to {output_dir}")
+    print("   Table                        |      Rows | Files | Seconds")
+    print("   -----------------------------|-----------|-------|--------")
+    for table, (rows, files, seconds) in results.items():
+        print(f"   {table:28} | {rows:9,} | {files:5} | {seconds:7.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the practice database to partitioned Parquet")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to export (opened read-only)")
+    parser.add_argument('--output-dir', default='parquet', help="directory of the Parquet datasets")
+    parser.add_argument('--table', action='append', help="table to export (repeatable, default: all)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help="rows fetched and written per row group")
+    parser.add_argument('--compression', choices=COMPRESSIONS, default='snappy',
+                        help="Parquet compression codec")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("📦 PARQUET EXPORT")
+    print("="*70)
+    if not exists(args.db):
+        parser.error(f"{args.db} not found; run enhanced_database_setup.py first")
+
+    results = export_database(args.db, args.output_dir, args.table, args.batch_size, args.compression)
+    print_export_summary(results, args.output_dir)
+    print(f"\n✅ Exported {len(results)} tables")
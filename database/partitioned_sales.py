@@ -0,0 +1,408 @@
+"""
+EPAM Practice Database - Partitioned Sales
+Optional layout that stores sales as one table per month behind a UNION ALL view.
+
+partition_sales() moves the rows of the sales table into monthly tables
+(sales_2024_01, sales_2024_02, ...), each with its own copy of the sales
+indexes, and replaces the table with a view of the same name:
+
+    CREATE VIEW sales AS
+        SELECT * FROM sales_2024_01 UNION ALL SELECT * FROM sales_2024_02 ...
+
+Every existing query keeps working against the view, and an INSTEAD OF
+INSERT trigger sends new rows to their month, so --append-days works too.
+SQLite pushes a WHERE on the view into each branch, but it still visits
+every partition. query_sales() goes further: it rewrites {sales} in a
+query into a UNION ALL of only the months a date range touches.
+
+    query_sales(conn, '''
+        SELECT rep_id, sale_date,
+               SUM(total_amount) OVER (PARTITION BY rep_id ORDER BY sale_date)
+        FROM {sales}
+    ''', '2024-03-01', '2024-03-31')
+
+Old months are cheap to get rid of: drop_partition() is a DROP TABLE
+instead of a DELETE of every row plus index maintenance, and
+archive_partition() moves a month into a per-year database file
+(sales_2023.db). The router also finds partitions in attached archives.
+Either way the month also leaves the sales summary tables, which always
+match the sales view. The last month cannot be removed: the view needs
+at least one table (--unpartition instead).
+"""
+
+import argparse
+import os
+import random
+import re
+import statistics
+import time
+from datetime import date, timedelta
+from db_connection import DEFAULT_DB_PATH, connect, exists
+from sales_summaries import delete_summary_month
+
+SALES_TABLE = 'sales'
+INSERT_TRIGGER = 'sales_partition_insert'
+PARTITION_GLOB = 'sales_[0-9][0-9][0-9][0-9]_[0-9][0-9]'
+
+# Date-range window query timed by --benchmark
+BENCHMARK_SQL = '''
+    SELECT rep_id, sale_date, total_amount,
+           SUM(total_amount) OVER (
+               PARTITION BY rep_id ORDER BY sale_date
+               ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+           ) AS running_total
+    FROM {sales}
+    WHERE sale_date BETWEEN :start_date AND :end_date
+'''
+
+
+def partition_table(month):
+    """Table holding one month, e.g. '2024-03' -> 'sales_2024_03'"""
+    return f"{SALES_TABLE}_{month.replace('-', '_')}"
+
+
+def _month_of(table):
+    return table[len(SALES_TABLE) + 1:].replace('_', '-')
+
+
+def is_partitioned(conn):
+    """True when sales is the UNION ALL view of monthly tables"""
+    row = conn.execute("SELECT type FROM sqlite_master WHERE name = ?", (SALES_TABLE,)).fetchone()
+    return row is not None and row[0] == 'view'
+
+
+def partitions(conn, schemas=None):
+    """[(month, qualified table)] of every partition in main and the attached databases"""
+    if schemas is None:
+        schemas = [row[1] for row in conn.execute('PRAGMA database_list') if row[1] != 'temp']
+    found = []
+    for schema in schemas:
+        for (table,) in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table' AND name GLOB ?", (PARTITION_GLOB,)
+        ):
+            found.append((_month_of(table), table if schema == 'main' else f'{schema}.{table}'))
+    return sorted(found)
+
+
+def _columns(conn, table):
+    return [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+
+
+def _renamed_table_sql(sql, table):
+    """CREATE TABLE statement of sql under another name (and schema)"""
+    return re.sub(r'CREATE TABLE\s+[\w.]+', f'CREATE TABLE {table}', sql, count=1)
+
+
+def _renamed_index_sql(sql, old_table, new_table):
+    """CREATE INDEX statement of old_table rewritten for new_table"""
+    sql = re.sub(rf'\bidx_{old_table}(?=_)', f'idx_{new_table}', sql, count=1)
+    return re.sub(rf'\bON\s+{old_table}\s*\(', f'ON {new_table}(', sql, count=1)
+
+
+def _template(conn):
+    """(CREATE TABLE sql, [CREATE INDEX sql]) of the sales table or its first partition"""
+    table = SALES_TABLE if not is_partitioned(conn) else partitions(conn, ['main'])[0][1]
+    table_sql = conn.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                             (table,)).fetchone()[0]
+    index_sqls = [sql for (sql,) in conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (table,)
+    )]
+    return table, table_sql, index_sqls
+
+
+def create_partition(conn, month, schema='main'):
+    """Create the (empty) table of one month with the sales indexes; returns its name"""
+    source, table_sql, index_sqls = _template(conn)
+    table = partition_table(month)
+    conn.execute(_renamed_table_sql(table_sql, f'{schema}.{table}'))
+    for index_sql in index_sqls:
+        index_sql = _renamed_index_sql(index_sql, source, table)
+        conn.execute(index_sql.replace('CREATE INDEX ', f'CREATE INDEX {schema}.', 1))
+    return table
+
+
+def rebuild_view(conn):
+    """(Re)create the sales view and its insert trigger over the partitions in main"""
+    tables = [table for _, table in partitions(conn, ['main'])]
+    conn.execute(f'DROP TRIGGER IF EXISTS {INSERT_TRIGGER}')
+    conn.execute(f'DROP VIEW IF EXISTS {SALES_TABLE}')
+    if not tables:
+        return
+    conn.execute(f"CREATE VIEW {SALES_TABLE} AS "
+                 + ' UNION ALL '.join(f'SELECT * FROM {table}' for table in tables))
+    columns = _columns(conn, tables[0])
+    new_values = ', '.join(f'NEW.{column}' for column in columns)
+    months = [month for month, _ in partitions(conn, ['main'])]
+    branches = ''.join(
+        f"INSERT INTO {partition_table(month)} SELECT {new_values} "
+        f"WHERE substr(NEW.sale_date, 1, 7) = '{month}';\n"
+        for month in months
+    )
+    # A row for a month without a table would otherwise vanish (see ensure_partitions)
+    branches += (f"SELECT RAISE(ABORT, 'no sales partition for this month') WHERE NEW.sale_date IS NULL "
+                 f"OR substr(NEW.sale_date, 1, 7) NOT IN ({', '.join(repr(month) for month in months)});\n")
+    conn.execute(f"CREATE TRIGGER {INSERT_TRIGGER} INSTEAD OF INSERT ON {SALES_TABLE} BEGIN\n{branches}END")
+
+
+def ensure_partitions(conn, first_day, last_day):
+    """Create the missing months between two dates (e.g. before an append); returns their tables"""
+    existing = {month for month, _ in partitions(conn, ['main'])}
+    months = sorted({
+        (first_day + timedelta(days=offset)).isoformat()[:7]
+        for offset in range((last_day - first_day).days + 1)
+    })
+    tables = [partition_table(month) for month in months]
+    created = [create_partition(conn, month) for month in months if month not in existing]
+    if created:
+        rebuild_view(conn)
+    return tables
+
+
+def partition_sales(conn):
+    """Move the sales table into monthly partitions behind a view; returns {month: rows}"""
+    if is_partitioned(conn):
+        raise ValueError("sales is already partitioned")
+    if conn.execute(f"SELECT COUNT(*) FROM {SALES_TABLE} WHERE sale_date IS NULL").fetchone()[0]:
+        raise ValueError("sales has rows without a sale_date; they cannot be assigned to a month")
+    months = [month for (month,) in conn.execute(
+        f"SELECT DISTINCT substr(sale_date, 1, 7) FROM {SALES_TABLE} ORDER BY 1"
+    )]
+    moved = {}
+    conn.commit()
+    conn.execute('BEGIN')
+    for month in months:
+        table = create_partition(conn, month)
+        # Indexes are filled during the copy; a month is small enough that this is cheap
+        moved[month] = conn.execute(
+            f"INSERT INTO {table} SELECT * FROM {SALES_TABLE} "
+            f"WHERE sale_date >= ? AND sale_date < ? ORDER BY sale_id", (f'{month}-01', f'{month}-32')
+        ).rowcount
+    conn.execute(f'DROP TABLE {SALES_TABLE}')
+    rebuild_view(conn)
+    conn.commit()
+    for month in months:
+        conn.execute(f'ANALYZE {partition_table(month)}')
+    conn.commit()
+    return moved
+
+
+def unpartition_sales(conn):
+    """Turn the monthly partitions back into one sales table; returns its row count"""
+    if not is_partitioned(conn):
+        raise ValueError("sales is not partitioned")
+    source, table_sql, index_sqls = _template(conn)
+    tables = [table for _, table in partitions(conn, ['main'])]
+    conn.commit()
+    conn.execute('BEGIN')
+    conn.execute(f'DROP TRIGGER {INSERT_TRIGGER}')
+    conn.execute(f'DROP VIEW {SALES_TABLE}')
+    conn.execute(_renamed_table_sql(table_sql, SALES_TABLE))
+    rows = 0
+    for table in tables:
+        rows += conn.execute(f'INSERT INTO {SALES_TABLE} SELECT * FROM {table} ORDER BY sale_id').rowcount
+        conn.execute(f'DROP TABLE {table}')
+    for index_sql in index_sqls:
+        conn.execute(_renamed_index_sql(index_sql, source, SALES_TABLE))
+    conn.commit()
+    conn.execute(f'ANALYZE {SALES_TABLE}')
+    conn.commit()
+    return rows
+
+
+def drop_partitions(conn):
+    """Remove the view, trigger and every partition in main (before a rebuild)"""
+    conn.execute(f'DROP TRIGGER IF EXISTS {INSERT_TRIGGER}')
+    if is_partitioned(conn):
+        conn.execute(f'DROP VIEW {SALES_TABLE}')
+    for _, table in partitions(conn, ['main']):
+        conn.execute(f'DROP TABLE {table}')
+    conn.commit()
+
+
+def _check_removable(conn, month):
+    months = [partition_month for partition_month, _ in partitions(conn, ['main'])]
+    if month not in months:
+        raise ValueError(f"sales has no partition for {month}")
+    if len(months) == 1:
+        raise ValueError(f"{month} is the last sales partition; the sales view needs at least one")
+
+
+def drop_partition(conn, month):
+    """Drop one month and its summary rows; returns the sales rows that went with it"""
+    _check_removable(conn, month)
+    table = partition_table(month)
+    rows = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+    conn.commit()
+    conn.execute('BEGIN')  # The DDL would otherwise run outside the transaction
+    conn.execute(f'DROP TABLE {table}')
+    rebuild_view(conn)
+    delete_summary_month(conn, month)
+    conn.commit()
+    return rows
+
+
+def archive_path(directory, month):
+    """Per-year archive database of a month, e.g. directory/sales_2023.db"""
+    return os.path.join(directory, f'{SALES_TABLE}_{month[:4]}.db')
+
+
+def archive_partition(conn, month, directory):
+    """Move one month into its per-year archive file (out of the summaries); returns (path, rows)"""
+    _check_removable(conn, month)
+    path = archive_path(directory, month)
+    table = partition_table(month)
+    conn.commit()  # ATTACH is not allowed inside a transaction
+    conn.execute('ATTACH DATABASE ? AS archive', (path,))
+    try:
+        conn.execute('BEGIN')
+        conn.execute(f'DROP TABLE IF EXISTS archive.{table}')
+        create_partition(conn, month, schema='archive')
+        rows = conn.execute(f'INSERT INTO archive.{table} SELECT * FROM main.{table}').rowcount
+        conn.execute(f'DROP TABLE main.{table}')
+        rebuild_view(conn)
+        delete_summary_month(conn, month)
+        conn.commit()
+    finally:
+        conn.execute('DETACH DATABASE archive')
+    return path, rows
+
+
+def attach_archives(conn, directory):
+    """ATTACH every per-year archive in directory so query_sales() can reach them"""
+    attached = []
+    for name in sorted(os.listdir(directory)):
+        match = re.fullmatch(rf'{SALES_TABLE}_(\d{{4}})\.db', name)
+        if match:
+            schema = f'archive_{match.group(1)}'
+            conn.execute('ATTACH DATABASE ? AS ' + schema, (os.path.join(directory, name),))
+            attached.append(schema)
+    return attached
+
+
+def partitions_between(conn, start_date, end_date):
+    """Qualified partition tables whose month overlaps start_date .. end_date (ISO dates)"""
+    return [table for month, table in partitions(conn) if start_date[:7] <= month <= end_date[:7]]
+
+
+def routed_sales(conn, start_date, end_date):
+    """Subquery over only the sales partitions a date range touches
+
+    Months the range covers completely are read whole, a plain sequential
+    scan; only the first and last month are filtered to :start_date ..
+    :end_date. On an unpartitioned database this is just the filtered sales
+    table.
+    """
+    where = 'WHERE sale_date BETWEEN :start_date AND :end_date'
+    if not is_partitioned(conn):
+        return f'(SELECT * FROM {SALES_TABLE} {where})'
+    branches = []
+    for month, table in partitions(conn):
+        if start_date[:7] <= month <= end_date[:7]:
+            covered = start_date <= f'{month}-01' and f'{month}-31' <= end_date
+            branches.append(f'SELECT * FROM {table} NOT INDEXED' if covered else f'SELECT * FROM {table} {where}')
+    if not branches:
+        return f'(SELECT * FROM {SALES_TABLE} WHERE 0)'
+    return '(' + ' UNION ALL '.join(branches) + ')'
+
+
+def query_sales(conn, sql, start_date, end_date, params=None):
+    """Run sql with {sales} replaced by routed_sales(); returns the cursor
+
+    :start_date and :end_date are bound for the routed subquery and can be
+    used in sql as well.
+    """
+    params = dict(params or {}, start_date=str(start_date), end_date=str(end_date))
+    return conn.execute(sql.replace('{sales}', routed_sales(conn, params['start_date'], params['end_date'])),
+                        params)
+
+
+def benchmark(conn, iterations=20, days=31, seed=None):
+    """p50/p95 ms of BENCHMARK_SQL over random date ranges, per access path"""
+    rng = random.Random(seed)
+    first, last = [date.fromisoformat(value[:10]) for value in conn.execute(
+        f"SELECT MIN(sale_date), MAX(sale_date) FROM {SALES_TABLE}").fetchone()]
+    ranges = []
+    for _ in range(iterations):
+        start = first + timedelta(days=rng.randint(0, max(0, (last - first).days - days + 1)))
+        ranges.append((start.isoformat(), (start + timedelta(days=days - 1)).isoformat()))
+
+    paths = {'view' if is_partitioned(conn) else 'table': lambda start, end: conn.execute(
+        BENCHMARK_SQL.replace('{sales}', SALES_TABLE), {'start_date': start, 'end_date': end})}
+    if is_partitioned(conn):
+        paths['routed'] = lambda start, end: query_sales(conn, BENCHMARK_SQL, start, end)
+
+    results = {}
+    for path, run in paths.items():
+        latencies = []
+        for start, end in ranges:
+            begin = time.perf_counter()
+            run(start, end).fetchall()
+            latencies.append((time.perf_counter() - begin) * 1000)
+        latencies.sort()
+        results[path] = {'p50_ms': round(statistics.median(latencies), 2),
+                         'p95_ms': round(latencies[int(0.95 * (len(latencies) - 1))], 2)}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Store sales as monthly partitions behind a UNION ALL view")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to change")
+    layout = parser.add_mutually_exclusive_group()
+    layout.add_argument('--partition', action='store_true', help="split the sales table into monthly tables")
+    layout.add_argument('--unpartition', action='store_true', help="merge the partitions back into one table")
+    parser.add_argument('--drop-before', metavar='YYYY-MM', help="drop every month before this one")
+    parser.add_argument('--archive-before', metavar='YYYY-MM',
+                        help="move every month before this one into per-year files in --archive-dir")
+    parser.add_argument('--archive-dir', default='sales_archive', help="directory of the per-year archives")
+    parser.add_argument('--vacuum', action='store_true', help="VACUUM afterwards to give the freed pages back")
+    parser.add_argument('--benchmark', type=int, metavar='ITERATIONS',
+                        help="time a one-month window query on the current layout")
+    parser.add_argument('--seed', type=int, help="seed for the benchmark date ranges")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🗓️  PARTITIONED SALES")
+    print("="*70)
+    if not exists(args.db):
+        parser.error(f"{args.db} not found; run enhanced_database_setup.py first")
+
+    conn = connect(args.db)
+    try:
+        if args.unpartition:
+            start = time.perf_counter()
+            rows = unpartition_sales(conn)
+            print(f"✅ Merged {rows:,} rows back into one sales table in {time.perf_counter() - start:.2f}s")
+        elif args.partition:
+            start = time.perf_counter()
+            moved = partition_sales(conn)
+            print(f"✅ Split {sum(moved.values()):,} sales rows into {len(moved)} monthly tables "
+                  f"in {time.perf_counter() - start:.2f}s")
+
+        if (args.archive_before or args.drop_before) and not is_partitioned(conn):
+            parser.error("sales is not partitioned; run with --partition first")
+        cutoff = max(args.archive_before or '', args.drop_before or '')
+        if cutoff and all(month < cutoff for month, _ in partitions(conn, ['main'])):
+            parser.error(f"every month is before {cutoff}; at least one partition has to stay")
+        if args.archive_before:
+            os.makedirs(args.archive_dir, exist_ok=True)
+            for month, _ in partitions(conn, ['main']):
+                if month < args.archive_before:
+                    path, rows = archive_partition(conn, month, args.archive_dir)
+                    print(f"📦 Archived {month} ({rows:,} rows) to {path}")
+        if args.drop_before:
+            for month, _ in partitions(conn, ['main']):
+                if month < args.drop_before:
+                    start = time.perf_counter()
+                    rows = drop_partition(conn, month)
+                    print(f"🗑️  Dropped {month} ({rows:,} rows) in {(time.perf_counter() - start) * 1000:.1f} ms")
+        if args.vacuum:
+            start = time.perf_counter()
+            conn.execute('VACUUM')
+            print(f"🧹 Vacuumed in {time.perf_counter() - start:.2f}s")
+
+        if args.benchmark:
+            print(f"\n⏱️  One-month running-total query, {args.benchmark} random ranges:")
+            for path, stats in benchmark(conn, args.benchmark, seed=args.seed).items():
+                print(f"   {path:7} p50 {stats['p50_ms']:8.2f} ms | p95 {stats['p95_ms']:8.2f} ms")
+    finally:
+        conn.close()
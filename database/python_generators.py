@@ -0,0 +1,296 @@
+"""
+EPAM Practice Database - Python Fact Table Generators
+Row-at-a-time generators for the large fact tables of the enhanced database.
+
+Every generate_* function is a generator that yields the rows of one table
+as tuples in column order, so the caller can stream them into executemany()
+in chunks without holding the whole table in memory. numpy_generators.py
+exposes the same functions built from vectorized NumPy draws.
+
+Each generator owns its random stream, created from its seed argument, so a
+table comes out the same whether it is built alone, after other tables or in
+a separate worker process. sales is built as monthly partitions
+(sales_partitions + generate_sales_partition) so the months can be generated
+in parallel too. Dates are relative to the reference_date argument ("today"
+for a normal run) rather than the clock, so seeded runs are reproducible.
+
+Names, phone numbers and addresses are drawn from a FakerPool (see
+faker_pool.py), so the number of Faker calls does not grow with the table.
+names='stdlib' fills the pool from small built-in word lists instead of
+Faker, for setups without third-party packages.
+"""
+
+import hashlib
+import random
+from datetime import timedelta
+
+from faker_pool import POOL_SIZE, FakerPool
+
+ITEMS_PER_ORDER = [1, 2, 3, 4, 5]  # Cycled then shuffled: exactly 3 items/order on average
+SALES_DAYS = 360                   # 12 "months" of 30 days
+SALES_PARTITION_DAYS = 30          # One sales partition per month
+
+ORDER_STATUSES = ['Pending', 'Processing', 'Shipped', 'Delivered', 'Cancelled', 'Returned']
+ORDER_STATUS_WEIGHTS = [5, 10, 20, 60, 3, 2]  # Most delivered
+PAYMENT_METHODS = ['Credit Card', 'Debit Card', 'PayPal', 'Apple Pay', 'Google Pay', 'Bank Transfer']
+TRANSACTION_DESCRIPTIONS = [
+    'Sales Revenue', 'Cost of Goods Sold', 'Salary Payment', 'Office Rent',
+    'Equipment Purchase', 'Loan Payment', 'Interest Income', 'Insurance Payment',
+    'Marketing Expense', 'Utilities Payment', 'Customer Payment', 'Vendor Payment'
+]
+MOVEMENT_TYPES = ['IN', 'OUT', 'TRANSFER', 'ADJUSTMENT']
+CUSTOMER_SEGMENTS = ['Premium', 'Standard', 'Budget', 'Enterprise']
+STATES = ['NY', 'CA', 'TX', 'FL', 'IL', 'PA', 'OH', 'GA', 'NC', 'MI']
+CITIES = ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia',
+          'San Antonio', 'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville']
+STREET_NAMES = ['Main St', 'Oak Ave', 'Maple Dr', 'Cedar Ln', 'Pine St', 'Elm St',
+                'Washington Blvd', 'Lake View Rd', 'Park Ave', 'Sunset Blvd']
+FIRST_NAMES = ['John', 'Jane', 'Mike', 'Sarah', 'David', 'Lisa', 'Chris', 'Amy', 'Mark', 'Emma',
+               'James', 'Jessica', 'Robert', 'Jennifer', 'Michael', 'Ashley', 'William', 'Emily',
+               'Richard', 'Amanda', 'Joseph', 'Melissa', 'Thomas', 'Deborah', 'Charles', 'Dorothy']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+              'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
+              'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson']
+NAME_SOURCES = ['faker', 'stdlib']
+NUM_WAREHOUSES = 5
+NUM_TERRITORIES = 6
+NUM_ACCOUNTS = 10
+
+
+def derive_seed(seed, *parts):
+    """Stable 63-bit seed for a table or partition derived from the run seed
+
+    derive_seed(None, ...) stays None, which means "fresh entropy".
+    """
+    if seed is None:
+        return None
+    key = ':'.join(str(part) for part in (seed,) + parts).encode()
+    return int.from_bytes(hashlib.sha256(key).digest()[:8], 'big') >> 1
+
+
+class StdlibNames:
+    """Faker-style provider built from the word lists above (no third-party imports)"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def first_name(self):
+        return self.rng.choice(FIRST_NAMES)
+
+    def last_name(self):
+        return self.rng.choice(LAST_NAMES)
+
+    def name(self):
+        return f"{self.first_name()} {self.last_name()}"
+
+    def phone_number(self):
+        return f"({self.rng.randint(100, 999)}) {self.rng.randint(100, 999)}-{self.rng.randint(1000, 9999)}"
+
+    def address(self):
+        return (f"{self.rng.randint(100, 9999)} {self.rng.choice(STREET_NAMES)}, "
+                f"{self.rng.choice(CITIES)}, {self.rng.choice(STATES)}")
+
+
+def make_pool(names='faker', seed=None, size=POOL_SIZE):
+    """Value pool for names, phone numbers and addresses from one of NAME_SOURCES"""
+    if names == 'stdlib':
+        return FakerPool(seed, size, StdlibNames(seed))
+    if names != 'faker':
+        raise ValueError(f"Unknown name source: {names}")
+    return FakerPool(seed, size)
+
+
+def random_date(rng, start_date, end_date):
+    """Uniform date between start_date and end_date (both included)"""
+    return start_date + timedelta(days=rng.randint(0, (end_date - start_date).days))
+
+
+def items_per_order(num_orders, rng=random):
+    """Shuffled 1-5 item counts whose total only depends on the number of orders"""
+    counts = [ITEMS_PER_ORDER[i % len(ITEMS_PER_ORDER)] for i in range(num_orders)]
+    rng.shuffle(counts)
+    return counts
+
+
+def daily_sales_counts(total_sales, rng=random, days=SALES_DAYS):
+    """Spread exactly total_sales over the given days with a 50-200 per day shape"""
+    weights = [rng.randint(50, 200) for _ in range(days)]
+    weight_sum = sum(weights)
+    counts = [total_sales * w // weight_sum for w in weights]
+
+    # Hand out the rounding remainder so the total is exact
+    for day in range(total_sales - sum(counts)):
+        counts[day % days] += 1
+    return counts
+
+
+def sales_partitions(num_sales, seed=None, days=SALES_DAYS, first_sale_id=1):
+    """Split the sales days into monthly partitions
+
+    Returns a list of (first_day, day_counts, first_sale_id) tuples; the
+    sale IDs of consecutive partitions are contiguous.
+    """
+    day_counts = daily_sales_counts(num_sales, random.Random(seed), days)
+    partitions = []
+
+    for first_day in range(0, days, SALES_PARTITION_DAYS):
+        counts = day_counts[first_day:first_day + SALES_PARTITION_DAYS]
+        partitions.append((first_day, counts, first_sale_id))
+        first_sale_id += sum(counts)
+
+    return partitions
+
+
+def generate_customers(num_customers, reference_date, names='faker', seed=None):
+    """Generate realistic customer profiles"""
+    rng = random.Random(seed)
+    pool = make_pool(names, seed, min(POOL_SIZE, num_customers))
+
+    for i in range(num_customers):
+        customer_id = i + 1
+        first_name = pool.pick(rng, 'first_name')
+        last_name = pool.pick(rng, 'last_name')
+        email = f"{first_name.lower()}.{last_name.lower()}{customer_id}@email.com"  # Unique at any scale
+        phone = pool.pick(rng, 'phone_number')[:15]
+        dob = random_date(rng, reference_date - timedelta(days=80 * 365),
+                          reference_date - timedelta(days=18 * 365))
+        reg_date = random_date(rng, reference_date - timedelta(days=3 * 365), reference_date)
+        city = rng.choice(CITIES)
+        state = rng.choice(STATES)
+        segment = rng.choice(CUSTOMER_SEGMENTS)
+        is_vip = rng.choices([0, 1], weights=[85, 15])[0]  # 15% VIP
+        total_spent = round(rng.uniform(0, 5000), 2) if is_vip else round(rng.uniform(0, 1000), 2)
+
+        yield (
+            customer_id, first_name, last_name, email, phone, dob, reg_date,
+            city, state, 'USA', segment, is_vip, total_spent
+        )
+
+
+def generate_orders(num_orders, num_customers, reference_date, names='faker', seed=None,
+                    first_order_id=1, days_back=365):
+    """Generate realistic order rows dated in the days_back days up to reference_date"""
+    rng = random.Random(seed)
+    pool = make_pool(names, seed, min(POOL_SIZE, num_orders))
+
+    for i in range(num_orders):
+        order_id = first_order_id + i
+        customer_id = rng.randint(1, num_customers)
+        order_date = random_date(rng, reference_date - timedelta(days=days_back), reference_date)
+        status = rng.choices(ORDER_STATUSES, weights=ORDER_STATUS_WEIGHTS)[0]
+        shipping_address = pool.pick(rng, 'address')
+        billing_address = shipping_address if rng.random() > 0.3 else pool.pick(rng, 'address')
+        payment_method = rng.choice(PAYMENT_METHODS)
+        subtotal = round(rng.uniform(25, 1500), 2)
+        tax_amount = round(subtotal * 0.08, 2)  # 8% tax
+        shipping_cost = round(rng.uniform(0, 25), 2) if subtotal < 50 else 0
+        total_amount = subtotal + tax_amount + shipping_cost
+        warehouse_id = rng.randint(1, NUM_WAREHOUSES)
+
+        yield (
+            order_id, customer_id, order_date, status, shipping_address,
+            billing_address, payment_method, subtotal, tax_amount, shipping_cost,
+            total_amount, warehouse_id
+        )
+
+
+def generate_order_items(num_orders, product_prices, seed=None, first_order_id=1, first_item_id=1):
+    """Generate 1-5 line items per order, priced from product_prices (product_id -> price)"""
+    rng = random.Random(seed)
+    num_products = len(product_prices)
+    order_item_id = first_item_id - 1
+
+    for order_id, num_items in enumerate(items_per_order(num_orders, rng), start=first_order_id):
+        for item_num in range(num_items):
+            order_item_id += 1
+            product_id = rng.randint(1, num_products)
+            quantity = rng.randint(1, 3)
+
+            unit_price = product_prices[product_id]
+            total_price = unit_price * quantity
+
+            yield (
+                order_item_id, order_id, product_id, quantity, unit_price, total_price
+            )
+
+
+def generate_sales_partition(first_day, day_counts, first_sale_id, rep_commission_rates,
+                             num_products, reference_date, seed=None):
+    """Generate the sales of one partition (see sales_partitions)"""
+    rng = random.Random(seed)
+    num_reps = len(rep_commission_rates)
+    start_date = reference_date - timedelta(days=365)
+    sale_id = first_sale_id - 1
+
+    for day, day_sales in enumerate(day_counts, start=first_day):
+        daily_date = start_date + timedelta(days=day)
+
+        for sale_num in range(day_sales):
+            sale_id += 1
+            rep_id = rng.randint(1, num_reps)
+            territory_id = rng.randint(1, NUM_TERRITORIES)
+            product_id = rng.randint(1, num_products)
+            quantity = rng.randint(1, 10)
+            unit_price = round(rng.uniform(25, 500), 2)
+            total_amount = unit_price * quantity
+
+            commission_earned = total_amount * rep_commission_rates[rep_id]
+
+            yield (
+                sale_id, rep_id, territory_id, daily_date.strftime('%Y-%m-%d'),
+                product_id, quantity, unit_price, total_amount, round(commission_earned, 2)
+            )
+
+
+def generate_sales(num_sales, rep_commission_rates, num_products, reference_date, seed=None):
+    """Generate daily sales for the past 12 months (rep_commission_rates: rep_id -> rate)"""
+    # 50-200 sales per day (times the scale factor), exact total per scale factor
+    for index, partition in enumerate(sales_partitions(num_sales, seed)):
+        yield from generate_sales_partition(*partition, rep_commission_rates, num_products,
+                                            reference_date, seed=derive_seed(seed, index))
+
+
+def generate_financial_transactions(num_transactions, reference_date, seed=None,
+                                    first_transaction_id=1, days_back=365):
+    """Generate debit/credit ledger entries for the past year"""
+    rng = random.Random(seed)
+
+    for i in range(num_transactions):
+        transaction_id = first_transaction_id + i
+        account_id = rng.randint(1, NUM_ACCOUNTS)
+        transaction_date = random_date(rng, reference_date - timedelta(days=days_back), reference_date)
+        description = rng.choice(TRANSACTION_DESCRIPTIONS)
+
+        # Generate debit or credit amounts
+        if rng.random() > 0.5:
+            debit_amount = round(rng.uniform(100, 50000), 2)
+            credit_amount = 0
+        else:
+            debit_amount = 0
+            credit_amount = round(rng.uniform(100, 50000), 2)
+
+        reference_number = f"REF{rng.randint(100000, 999999)}"
+
+        yield (
+            transaction_id, account_id, transaction_date, description,
+            debit_amount, credit_amount, reference_number
+        )
+
+
+def generate_inventory_movements(num_movements, num_products, reference_date, seed=None):
+    """Generate stock movements for the past 6 months"""
+    rng = random.Random(seed)
+
+    for i in range(num_movements):
+        movement_id = i + 1
+        product_id = rng.randint(1, num_products)
+        warehouse_id = rng.randint(1, NUM_WAREHOUSES)
+        movement_type = rng.choice(MOVEMENT_TYPES)
+        quantity = rng.randint(1, 100)
+        movement_date = random_date(rng, reference_date - timedelta(days=182), reference_date)
+        reference_number = f"MOV{rng.randint(10000, 99999)}"
+
+        yield (
+            movement_id, product_id, warehouse_id, movement_type,
+            quantity, movement_date, reference_number
+        )
@@ -0,0 +1,189 @@
+"""
+EPAM Practice Database - Sample Query Harness
+Times the test_enhanced_database queries as a repeatable benchmark.
+
+Each sample query runs a few untimed warm-up iterations and then a number of
+timed ones, every iteration with freshly randomized parameters: a customer ID
+range, an order status and a department drawn from the values the database
+actually holds. The latencies are summarized as min/mean/p50/p95/p99/max.
+
+Two cache modes are measured:
+- warm: one connection, so SQLite's page cache persists across iterations.
+- cold: a new connection for every iteration, so each query starts with an
+  empty page cache. The operating system's file cache cannot be dropped
+  portably, so cold still reads from memory, not from the disk.
+
+--pragma applies settings such as cache_size to every connection. Results go
+to a JSON file, so runs at different scale factors and pragma settings can be
+compared.
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import statistics
+import time
+import db_connection
+from db_connection import DEFAULT_DB_PATH
+from enhanced_database_setup import SAMPLE_PARAMS, SAMPLE_QUERIES
+
+CACHE_MODES = ['warm', 'cold']
+# Pragmas recorded with every run so results can be told apart
+REPORTED_PRAGMAS = ['page_size', 'cache_size', 'journal_mode', 'synchronous', 'mmap_size', 'temp_store']
+# Width of the randomized customer ID range
+CUSTOMER_RANGE = 3
+
+
+def connect(db_path, pragmas=()):
+    """Read-only connection with the requested pragmas applied"""
+    conn = db_connection.connect(db_path, read_only=True)
+    for pragma in pragmas:
+        conn.execute(f'PRAGMA {pragma}')
+    return conn
+
+
+def parameter_space(conn):
+    """Values the sample query parameters are drawn from"""
+    return {
+        'max_customer_id': conn.execute("SELECT MAX(customer_id) FROM customers").fetchone()[0],
+        'order_statuses': [row[0] for row in conn.execute("SELECT DISTINCT order_status FROM orders ORDER BY 1")],
+        'department_ids': [row[0] for row in conn.execute("SELECT department_id FROM departments ORDER BY 1")],
+        'rep_ids': [row[0] for row in conn.execute("SELECT rep_id FROM sales_reps ORDER BY 1")],
+    }
+
+
+def random_params(rng, space):
+    """One randomized set of sample query parameters"""
+    first_customer_id = rng.randint(1, max(1, space['max_customer_id'] - CUSTOMER_RANGE + 1))
+    return {
+        'first_customer_id': first_customer_id,
+        'last_customer_id': first_customer_id + CUSTOMER_RANGE - 1,
+        'order_status': rng.choice(space['order_statuses']),
+        'department_id': rng.choice(space['department_ids']),
+        'rep_id': rng.choice(space['rep_ids']),
+        'window_days': SAMPLE_PARAMS['window_days'],
+    }
+
+
+def percentile(sorted_values, fraction):
+    """Linear-interpolated percentile of already sorted values"""
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(latencies_ms, rows):
+    """Latency statistics of one query in one cache mode"""
+    ordered = sorted(latencies_ms)
+    return {
+        'iterations': len(ordered),
+        'min_ms': round(ordered[0], 3),
+        'mean_ms': round(statistics.fmean(ordered), 3),
+        'p50_ms': round(percentile(ordered, 0.50), 3),
+        'p95_ms': round(percentile(ordered, 0.95), 3),
+        'p99_ms': round(percentile(ordered, 0.99), 3),
+        'max_ms': round(ordered[-1], 3),
+        'mean_rows': round(statistics.fmean(rows), 1),
+    }
+
+
+def _timed(conn, sql, params):
+    start = time.perf_counter()
+    rows = len(conn.execute(sql, params).fetchall())
+    return (time.perf_counter() - start) * 1000, rows
+
+
+def run_query(db_path, sql, mode, iterations, warmup, rng, space, pragmas=()):
+    """Time one query: warm-up runs, then `iterations` timed runs with random parameters"""
+    latencies, rows = [], []
+    conn = connect(db_path, pragmas)
+    try:
+        for _ in range(warmup):
+            _timed(conn, sql, random_params(rng, space))
+        for _ in range(iterations):
+            if mode == 'cold':
+                conn.close()
+                conn = connect(db_path, pragmas)
+            elapsed, count = _timed(conn, sql, random_params(rng, space))
+            latencies.append(elapsed)
+            rows.append(count)
+    finally:
+        conn.close()
+    return summarize(latencies, rows)
+
+
+def run_benchmark(db_path=DEFAULT_DB_PATH, iterations=50, warmup=5, modes=CACHE_MODES, seed=None,
+                  pragmas=(), queries=SAMPLE_QUERIES):
+    """Benchmark every sample query in every cache mode; returns the JSON-ready report"""
+    rng = random.Random(seed)
+    conn = connect(db_path, pragmas)
+    try:
+        space = parameter_space(conn)
+        # In-memory databases return no row for mmap_size
+        settings = {name: (conn.execute(f'PRAGMA {name}').fetchone() or [None])[0] for name in REPORTED_PRAGMAS}
+        row_counts = {
+            table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            for table in ['customers', 'orders', 'order_items', 'sales']
+        }
+    finally:
+        conn.close()
+
+    results = {
+        name: {mode: run_query(db_path, sql, mode, iterations, warmup, rng, space, pragmas) for mode in modes}
+        for name, sql in queries.items()
+    }
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sqlite_version': sqlite3.sqlite_version,
+        'db': db_path if db_connection.is_uri(db_path) else os.path.abspath(db_path),
+        'iterations': iterations,
+        'warmup': warmup,
+        'seed': seed,
+        'pragmas': list(pragmas),
+        'settings': settings,
+        'row_counts': row_counts,
+        'default_params': SAMPLE_PARAMS,
+        'results': results,
+    }
+
+
+def print_report(report):
+    """Console table of the latency percentiles"""
+    print(f"\n⏱️  {report['iterations']} iterations after {report['warmup']} warm-up runs, "
+          f"{report['row_counts']['orders']:,} orders")
+    print("   Query          | Cache |  p50 ms |  p95 ms |  p99 ms |  max ms |   Rows")
+    print("   ---------------|-------|---------|---------|---------|---------|-------")
+    for name, modes in report['results'].items():
+        for mode, stats in modes.items():
+            print(f"   {name:14} | {mode:5} | {stats['p50_ms']:7.2f} | {stats['p95_ms']:7.2f} | "
+                  f"{stats['p99_ms']:7.2f} | {stats['max_ms']:7.2f} | {stats['mean_rows']:6.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the test_enhanced_database sample queries")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to query (opened read-only)")
+    parser.add_argument('--iterations', type=int, default=50, help="timed runs per query and cache mode")
+    parser.add_argument('--warmup', type=int, default=5, help="untimed runs before the timed ones")
+    parser.add_argument('--mode', choices=CACHE_MODES, action='append',
+                        help="cache mode to measure (repeatable, default: both)")
+    parser.add_argument('--seed', type=int, help="seed for the randomized parameters")
+    parser.add_argument('--pragma', action='append', default=[],
+                        help="pragma applied to every connection, e.g. 'cache_size = -65536' (repeatable)")
+    parser.add_argument('--output', default='query_harness.json', help="results file (JSON)")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🏁 SAMPLE QUERY BENCHMARK")
+    print("="*70)
+    if not db_connection.exists(args.db):
+        parser.error(f"{args.db} not found; run enhanced_database_setup.py first")
+
+    report = run_benchmark(args.db, args.iterations, args.warmup, args.mode or CACHE_MODES,
+                           args.seed, args.pragma)
+    print_report(report)
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
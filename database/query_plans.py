@@ -0,0 +1,238 @@
+"""
+EPAM Practice Database - Query Plan Capture
+Records EXPLAIN QUERY PLAN for the course queries and compares it with a golden copy.
+
+Every read-only statement of the solution and module files, plus the
+sample queries of test_enhanced_database (the only ones that filter sales by
+rep and date), is explained against a freshly built database, so the plans
+reflect the indexes that create_enhanced_database creates right now. The
+plan trees are compared with query_plans_golden.json. A query whose golden
+plan used one of the watched indexes (idx_sales_rep_date,
+idx_orders_customer_date) and that now falls back to a SCAN is a regression
+and makes the check exit with status 1. Other plan changes are only listed.
+--update rewrites the golden copy after an intended change.
+
+test_watched_indexes() guards the guard: a watched index that no golden
+plan uses could regress unnoticed, so the check (and --update) fails then too.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from db_connection import DEFAULT_DB_PATH, connect
+from sql_benchmark import MODULE_GLOBS, REPO_DIR, extract_sql_blocks, is_read_only, split_statements
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'query_plans_golden.json')
+
+# Indexes whose loss is a regression, not just a plan change
+WATCHED_INDEXES = ['idx_sales_rep_date', 'idx_orders_customer_date']
+
+
+def plan_tree(conn, statement, params=()):
+    """EXPLAIN QUERY PLAN of a statement as indented lines, e.g. '  SEARCH s USING INDEX ...'"""
+    rows = conn.execute(f'EXPLAIN QUERY PLAN {statement}', params).fetchall()
+    depth = {0: -1}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depth[node_id] = depth.get(parent_id, -1) + 1
+        lines.append('  ' * depth[node_id] + detail)
+    return lines
+
+
+def _strip_explain(statement):
+    """Statements that already start with EXPLAIN are explained without it"""
+    words = statement.split(None, 3)
+    if [word.upper() for word in words[:3]] == ['EXPLAIN', 'QUERY', 'PLAN']:
+        return words[3]
+    if words and words[0].upper() == 'EXPLAIN':
+        return statement.split(None, 1)[1]
+    return statement
+
+
+def _code_lines(statement):
+    return '\n'.join(line for line in statement.splitlines() if not line.strip().startswith('--')).strip()
+
+
+def explainable_sql(statement):
+    """A statement without its comments and without a leading EXPLAIN"""
+    return _strip_explain(_code_lines(statement))
+
+
+def sample_workload():
+    """[(id, sql, params)] of the test_enhanced_database sample queries"""
+    from enhanced_database_setup import SAMPLE_PARAMS, SAMPLE_QUERIES
+    return [(f'test_enhanced_database:{name}', explainable_sql(sql), SAMPLE_PARAMS)
+            for name, sql in SAMPLE_QUERIES.items()]
+
+
+def _plan_entry(conn, plans, plan_id, sql, params=()):
+    try:
+        plan = plan_tree(conn, sql, params)
+    except sqlite3.Error:
+        return  # other dialect or a table this database does not have
+    key = hashlib.sha1(sql.encode()).hexdigest()[:16]
+    plans[key] = {'id': plan_id, 'sql': sql, 'plan': plan}
+
+
+def capture_plans(db_path, paths, workload=()):
+    """{statement key: {'id', 'sql', 'plan'}} for every explainable statement
+
+    workload adds (id, sql, params) statements, e.g. sample_workload().
+    """
+    conn = connect(db_path, read_only=True)
+    plans = {}
+    try:
+        for plan_id, sql, params in workload:
+            _plan_entry(conn, plans, plan_id, sql, params)
+        for block in extract_sql_blocks(paths):
+            statements = split_statements(block['sql'])
+            if not is_read_only(statements):
+                continue
+            for number, statement in enumerate(statements, start=1):
+                _plan_entry(conn, plans, f"{block['id']}#{number}", explainable_sql(statement))
+    finally:
+        conn.close()
+    return plans
+
+
+def watched_indexes_used(plan):
+    """{index: table or alias} for the watched indexes that appear in a plan"""
+    used = {}
+    for line in plan:
+        words = line.split()
+        for index in WATCHED_INDEXES:
+            if f'INDEX {index}' in line and len(words) > 1:
+                used[index] = words[1]
+    return used
+
+
+def test_watched_indexes(plans):
+    """Watched indexes that appear in none of the plans (empty list = OK)"""
+    used = set()
+    for entry in plans.values():
+        used.update(watched_indexes_used(entry['plan']))
+    return [index for index in WATCHED_INDEXES if index not in used]
+
+
+def scans_table(plan, table):
+    """True when a plan reads table (or alias) without any index"""
+    return any(
+        line.split()[:2] == ['SCAN', table] and 'INDEX' not in line
+        for line in plan if line.strip()
+    )
+
+
+def compare_plans(golden, current):
+    """(regressions, changed, new, missing) between two plan captures
+
+    A regression is a query whose golden plan read a table through a watched
+    index and whose current plan scans that table instead.
+    """
+    regressions, changed = [], []
+    for key, expected in golden.items():
+        actual = current.get(key)
+        if actual is None or actual['plan'] == expected['plan']:
+            continue
+        now_used = watched_indexes_used(actual['plan'])
+        lost = [index for index, table in watched_indexes_used(expected['plan']).items()
+                if index not in now_used and scans_table(actual['plan'], table)]
+        if lost:
+            regressions.append((actual, expected, lost))
+        else:
+            changed.append((actual, expected))
+    new = [current[key] for key in current if key not in golden]
+    missing = [golden[key] for key in golden if key not in current]
+    return regressions, changed, new, missing
+
+
+def fresh_database(directory, scale_factor=1, seed=42):
+    """Build the enhanced database in directory and return its path"""
+    from enhanced_database_setup import create_enhanced_database
+    db_path = os.path.join(directory, DEFAULT_DB_PATH)
+    create_enhanced_database(scale_factor=scale_factor, seed=seed, db_path=db_path)
+    return db_path
+
+
+def _print_plan_diff(actual, expected):
+    print(f"   {actual['id']}")
+    for line in expected['plan']:
+        print(f"     - {line}")
+    for line in actual['plan']:
+        print(f"     + {line}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capture EXPLAIN QUERY PLAN of the course queries "
+                                                 "and check it against the golden copy")
+    parser.add_argument('--db', help="explain against this database instead of a fresh seeded build")
+    parser.add_argument('--scale-factor', type=float, default=1, help="scale factor of the fresh build")
+    parser.add_argument('--golden', default=GOLDEN_PATH, help="golden plan file (default: %(default)s)")
+    parser.add_argument('--update', action='store_true', help="write the current plans as the new golden copy")
+    parser.add_argument('--output', help="also write the current plans to this JSON file")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("🧭 QUERY PLAN CHECK")
+    print("="*70)
+
+    paths = sorted(path for pattern in MODULE_GLOBS for path in glob.glob(os.path.join(REPO_DIR, pattern)))
+    build_dir = None
+    if args.db:
+        db_path = args.db
+    else:
+        build_dir = tempfile.mkdtemp(prefix='epam_plans_')
+        db_path = fresh_database(build_dir, args.scale_factor)
+    try:
+        current = capture_plans(db_path, paths, sample_workload())
+    finally:
+        if build_dir:
+            shutil.rmtree(build_dir, ignore_errors=True)
+    print(f"\n🔎 Captured {len(current)} query plans from {len(paths)} files")
+
+    report = {'sqlite_version': sqlite3.sqlite_version, 'plans': current}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Plans written to {args.output}")
+
+    if args.update or not os.path.exists(args.golden):
+        unused = test_watched_indexes(current)
+        if unused:
+            print(f"❌ No captured plan uses {', '.join(unused)}; the golden copy could not catch its loss")
+            sys.exit(1)
+        with open(args.golden, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Golden copy written to {args.golden}")
+        sys.exit(0)
+
+    with open(args.golden) as f:
+        golden = json.load(f)
+    if golden.get('sqlite_version') != sqlite3.sqlite_version:
+        print(f"⚠️  Golden plans come from SQLite {golden.get('sqlite_version')}, "
+              f"this is {sqlite3.sqlite_version}; plan details may differ")
+
+    unused = test_watched_indexes(golden['plans'])
+    if unused:
+        print(f"❌ No golden plan uses {', '.join(unused)}; run with --update after adding a query that does")
+        sys.exit(1)
+
+    regressions, changed, new, missing = compare_plans(golden['plans'], current)
+    for actual, expected in changed:
+        print("\n📝 Plan changed:")
+        _print_plan_diff(actual, expected)
+    if new or missing:
+        print(f"\nℹ️  {len(new)} new and {len(missing)} removed queries (run with --update to record them)")
+    for actual, expected, lost in regressions:
+        print(f"\n❌ Stopped using {', '.join(lost)} and scans instead:")
+        _print_plan_diff(actual, expected)
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} plan regressions")
+        sys.exit(1)
+    print(f"\n✅ No plan regressions ({len(changed)} plans changed)")
@@ -0,0 +1,134 @@
+"""
+EPAM Practice Database - Sales Summary Tables
+Daily and monthly sales aggregates per territory, rep and product.
+
+Each summary table is derived from `sales` with one GROUP BY, so dashboard
+queries read a few hundred pre-aggregated rows instead of scanning the fact
+table. Refreshing is incremental: sales only grow at the end (see
+incremental_append.py), so a refresh deletes the newest period already in a
+summary, which may have been incomplete, and re-aggregates only the sales from
+that period onwards. The sale_date index keeps that range read small.
+
+monthly_revenue is refreshed the same way from the orders that were not
+cancelled or returned: their line items give the revenue, the product costs
+of those items the expenses, and the orders the customer and order counts.
+"""
+
+# (table suffix, key column) of every summary grain
+SUMMARY_GRAINS = [
+    ('territory', 'territory_id'),
+    ('rep', 'rep_id'),
+    ('product', 'product_id'),
+]
+# (table prefix, period column, expression computing it from sales, first sale_date of a period)
+SUMMARY_PERIODS = [
+    ('daily', 'sale_date', 'sale_date', '{period}'),
+    ('monthly', 'sale_month', "substr(sale_date, 1, 7)", '{period}-01'),
+]
+
+SUMMARY_TABLES = {
+    f'sales_{period}_by_{grain}': (period_column, period_sql, period_start, key_column)
+    for period, period_column, period_sql, period_start in SUMMARY_PERIODS
+    for grain, key_column in SUMMARY_GRAINS
+}
+
+
+def summary_ddl(table):
+    """CREATE TABLE statement of a summary table"""
+    period_column, _, _, key_column = SUMMARY_TABLES[table]
+    return f'''
+    CREATE TABLE {table} (
+        {period_column} TEXT NOT NULL,
+        {key_column} INTEGER NOT NULL,
+        sales_count INTEGER,
+        units_sold INTEGER,
+        revenue DECIMAL(14,2),
+        commission DECIMAL(12,2),
+        PRIMARY KEY ({period_column}, {key_column})
+    ) WITHOUT ROWID
+    '''
+
+
+def refresh_summary(conn, table):
+    """Bring one summary table up to date with sales; returns the rows (re)written"""
+    period_column, period_sql, period_start, key_column = SUMMARY_TABLES[table]
+    last_period = conn.execute(f"SELECT MAX({period_column}) FROM {table}").fetchone()[0]
+
+    where, params = '', ()
+    if last_period is not None:
+        conn.execute(f"DELETE FROM {table} WHERE {period_column} >= ?", (last_period,))
+        where, params = 'WHERE sale_date >= ?', (period_start.format(period=last_period),)
+
+    cursor = conn.execute(f'''
+        INSERT INTO {table}
+        SELECT {period_sql}, {key_column}, COUNT(*), SUM(quantity),
+               ROUND(SUM(total_amount), 2), ROUND(SUM(commission_earned), 2)
+        FROM sales
+        {where}
+        GROUP BY 1, 2
+    ''', params)
+    return cursor.rowcount
+
+
+def delete_summary_month(conn, month):
+    """Remove one YYYY-MM month from every summary table (its sales are gone); returns {table: rows}"""
+    deleted = {}
+    for table in existing_summaries(conn):
+        period_column = SUMMARY_TABLES[table][0]
+        # 'YYYY-MM' <= sale_month and sale_date < 'YYYY-MM-32' for both grains
+        deleted[table] = conn.execute(f"DELETE FROM {table} WHERE {period_column} >= ? AND {period_column} < ?",
+                                      (month, f'{month}-32')).rowcount
+    return deleted
+
+
+def refresh_monthly_revenue(conn):
+    """Bring monthly_revenue up to date with orders; returns the rows (re)written"""
+    last_month = conn.execute("SELECT MAX(month_id) FROM monthly_revenue").fetchone()[0]
+
+    where, params = '', ()
+    if last_month is not None:
+        conn.execute("DELETE FROM monthly_revenue WHERE month_id >= ?", (last_month,))
+        where, params = 'AND order_date >= ?', (f'{last_month // 100:04d}-{last_month % 100:02d}-01',)
+
+    # month_id is YYYYMM, so a refresh can delete and re-aggregate by it
+    cursor = conn.execute(f'''
+        INSERT INTO monthly_revenue
+        WITH kept_orders AS (
+            SELECT order_id, customer_id,
+                   CAST(strftime('%Y%m', order_date) AS INTEGER) AS month_id
+            FROM orders
+            WHERE order_status NOT IN ('Cancelled', 'Returned') {where}
+        ),
+        counts AS (
+            SELECT month_id, COUNT(DISTINCT customer_id) AS customer_count, COUNT(*) AS order_count
+            FROM kept_orders
+            GROUP BY month_id
+        ),
+        line_items AS (
+            SELECT o.month_id, SUM(oi.total_price) AS revenue, SUM(oi.quantity * p.cost) AS expenses
+            FROM kept_orders o
+            JOIN order_items oi ON oi.order_id = o.order_id
+            JOIN products p ON p.product_id = oi.product_id
+            GROUP BY o.month_id
+        )
+        SELECT month_id, month_id / 100, month_id % 100,
+               ROUND(COALESCE(revenue, 0), 2), ROUND(COALESCE(expenses, 0), 2),
+               ROUND(COALESCE(revenue, 0) - COALESCE(expenses, 0), 2),
+               customer_count, order_count
+        FROM counts LEFT JOIN line_items USING (month_id)
+    ''', params)
+    return cursor.rowcount
+
+
+def existing_summaries(conn):
+    """The summary tables present in the database"""
+    existing = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return [table for table in SUMMARY_TABLES if table in existing]
+
+
+def refresh_summaries(conn):
+    """Refresh every summary table that exists in the database: {table: rows (re)written}"""
+    refreshed = {table: refresh_summary(conn, table) for table in existing_summaries(conn)}
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'monthly_revenue'").fetchone():
+        refreshed['monthly_revenue'] = refresh_monthly_revenue(conn)
+    return refreshed
@@ -0,0 +1,978 @@
+"""
+EPAM Practice Database - Schema Registry
+Declarative description of every table the setup scripts can build.
+
+Each TableSpec holds a table's DDL, the function that fills it, the tables it
+depends on and its indexes. plan() orders a list of specs so every table is
+built after its dependencies, and PROFILES names the table lists and name
+sources the setup scripts build:
+
+- 'enhanced':  the full practice schema with Faker names (enhanced_database_setup.py)
+- 'stdlib':    the same schema with built-in word lists, no third-party packages
+               (enhanced_database_setup_fixed.py; _simple.py is an alias)
+- 'exercises': the small fixed tables used by the SQL exercises (setup_database.py)
+
+A builder is called as build(ctx, table) with a BuildContext and returns the
+number of rows it inserted. The small tables are inserted directly and kept in
+ctx.rows for the tables built from them; the scaled fact tables go through
+ctx.loader so they are streamed (or generated in parallel). Derived tables
+(the sales summaries) are built from other tables with SQL, after the loader
+has finished.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+from python_generators import random_date
+from sales_summaries import SUMMARY_TABLES, refresh_monthly_revenue, refresh_summary, summary_ddl
+
+
+class TableSpec:
+    """One table: DDL, row builder, dependencies and indexes"""
+
+    def __init__(self, name, ddl, build, depends_on=(), indexes=(), group=None, derived=False):
+        self.name = name
+        self.ddl = ddl
+        self.build = build
+        self.depends_on = tuple(depends_on)
+        self.indexes = list(indexes)
+        self.group = group  # Heading the table is listed under in the final statistics
+        self.derived = derived  # Built from other tables once every table is loaded
+
+
+class BuildContext:
+    """State shared by the table builders of one setup run"""
+
+    def __init__(self, conn, loader, generators, row_counts, reference_date, names, pool, rng=random):
+        self.conn = conn
+        self.loader = loader
+        self.generators = generators
+        self.row_counts = row_counts
+        self.reference_date = reference_date
+        self.names = names
+        self.pool = pool
+        self.rng = rng
+        self.rows = {}  # table -> inserted rows, for the small tables
+
+    def insert_sql(self, table):
+        """INSERT statement with one placeholder per column of table"""
+        num_columns = len(self.conn.execute(f'PRAGMA table_info({table})').fetchall())
+        return f"INSERT INTO {table} VALUES ({','.join('?' * num_columns)})"
+
+    def insert(self, table, rows):
+        """Insert a small table in one executemany() and remember its rows"""
+        self.loader.phases.add_rows('generate', len(rows))
+        with self.loader.phases.phase('insert', len(rows)):
+            self.conn.executemany(self.insert_sql(table), rows)
+        self.rows[table] = rows
+        return len(rows)
+
+
+def plan(specs):
+    """Order specs so that every table comes after the tables it depends on
+
+    Independent tables keep their registry order. Raises ValueError for a
+    dependency on a table that is not in specs or for a dependency cycle.
+    """
+    names = {spec.name for spec in specs}
+    for spec in specs:
+        missing = [dep for dep in spec.depends_on if dep not in names]
+        if missing:
+            raise ValueError(f"{spec.name} depends on unknown table(s): {', '.join(missing)}")
+
+    ordered, built = [], set()
+    remaining = list(specs)
+    while remaining:
+        ready = next((spec for spec in remaining if set(spec.depends_on) <= built), None)
+        if ready is None:
+            raise ValueError(f"Circular table dependencies: {', '.join(s.name for s in remaining)}")
+        ordered.append(ready)
+        built.add(ready.name)
+        remaining.remove(ready)
+    return ordered
+
+
+def static_rows(rows):
+    """Builder for a table with fixed contents"""
+    return lambda ctx, table: ctx.insert(table, rows)
+
+
+# =============================================================================
+# ENHANCED SCHEMA - BUILDERS
+# =============================================================================
+
+PRODUCT_NAMES = [
+    # Smartphones
+    'iPhone 15 Pro', 'Samsung Galaxy S24', 'Google Pixel 8', 'OnePlus 12',
+    'iPhone 14', 'Samsung Galaxy S23', 'Google Pixel 7', 'Xiaomi 13',
+    # Laptops
+    'MacBook Pro 16"', 'Dell XPS 15', 'HP Spectre x360', 'Lenovo ThinkPad X1',
+    'MacBook Air M2', 'Dell Inspiron 15', 'HP Pavilion', 'ASUS ROG Strix',
+    # Men Clothing
+    'Nike Air Max 270', 'Adidas Ultraboost', 'Levi\'s 501 Jeans', 'Ralph Lauren Polo',
+    'Under Armour Hoodie', 'Champion T-Shirt', 'Vans Classic Sneakers', 'Timberland Boots',
+    # Women Clothing
+    'Zara Blazer', 'H&M Dress', 'Forever 21 Jeans', 'Gap Sweater',
+    'Nike Sports Bra', 'Lululemon Leggings', 'Kate Spade Handbag', 'Coach Purse',
+    # Home & Garden
+    'Dyson V15 Vacuum', 'KitchenAid Mixer', 'Weber Grill', 'IKEA Bookshelf',
+    'Philips Hue Lights', 'Nest Thermostat', 'Roomba i7', 'Instant Pot',
+    # Books
+    'Python Programming', 'Data Science Handbook', 'Machine Learning Guide',
+    'Business Strategy', 'Personal Finance', 'History of Art', 'Cooking Masterclass',
+    # Sports
+    'Yoga Mat Premium', 'Resistance Bands Set', 'Adjustable Dumbbells',
+    'Basketball Official', 'Tennis Racket Pro', 'Cycling Helmet', 'Running Shoes'
+]
+PRODUCT_PRICES = [29.99, 49.99, 79.99, 99.99, 149.99, 199.99, 299.99, 499.99, 699.99, 999.99, 1299.99, 1599.99]
+
+JOB_TITLES = [
+    'CEO', 'CTO', 'CFO', 'VP Sales', 'VP Marketing', 'VP Engineering',
+    'Sales Director', 'Marketing Director', 'Engineering Director',
+    'Senior Sales Manager', 'Sales Manager', 'Account Executive',
+    'Senior Marketing Manager', 'Marketing Manager', 'Content Manager',
+    'Senior Software Engineer', 'Software Engineer', 'Junior Developer',
+    'DevOps Engineer', 'Data Scientist', 'Product Manager',
+    'HR Director', 'HR Manager', 'HR Specialist', 'Recruiter',
+    'Finance Director', 'Finance Manager', 'Financial Analyst',
+    'Operations Director', 'Operations Manager', 'Operations Analyst',
+    'Customer Service Manager', 'Customer Service Rep', 'Support Specialist'
+]
+MAJORS = ['Computer Science', 'Business Administration', 'Engineering', 'Mathematics',
+          'Physics', 'Chemistry', 'Biology', 'Psychology', 'English', 'History']
+ENROLLMENT_STATUSES = ['Enrolled', 'Completed', 'Dropped', 'In Progress']
+
+
+CATEGORIES = [
+    (1, 'Electronics', None, 'Electronic devices and accessories'),
+    (2, 'Smartphones', 1, 'Mobile phones and accessories'),
+    (3, 'Laptops', 1, 'Portable computers'),
+    (4, 'Clothing', None, 'Apparel and fashion'),
+    (5, 'Men Clothing', 4, 'Men\'s apparel'),
+    (6, 'Women Clothing', 4, 'Women\'s apparel'),
+    (7, 'Home & Garden', None, 'Home improvement and garden supplies'),
+    (8, 'Books', None, 'Books and educational materials'),
+    (9, 'Sports', None, 'Sports and outdoor equipment')
+]
+
+
+def category_tree_encoding(categories):
+    """{category_id: (path, lft, rgt, depth)} for (category_id, name, parent_id, ...) rows
+
+    path lists the IDs from the root down ('/1/3/'), lft/rgt are nested-set
+    bounds: the subtree of a category is every category with lft between
+    its lft and rgt.
+    """
+    children = {}
+    for category in categories:
+        children.setdefault(category[2], []).append(category[0])
+
+    encoding = {}
+    counter = 0
+
+    def visit(category_id, path, depth):
+        nonlocal counter
+        counter += 1
+        lft = counter
+        path = f'{path}{category_id}/'
+        for child_id in children.get(category_id, []):
+            visit(child_id, path, depth + 1)
+        counter += 1
+        encoding[category_id] = (path, lft, counter, depth)
+
+    for root_id in children.get(None, []):
+        visit(root_id, '/', 0)
+    if len(encoding) != len(categories):
+        raise ValueError("categories.parent_category_id does not form a tree")
+    return encoding
+
+
+def build_categories(ctx, table):
+    """Insert the category tree with its path and nested-set encoding"""
+    encoding = category_tree_encoding(CATEGORIES)
+    return ctx.insert(table, [category + encoding[category[0]] for category in CATEGORIES])
+
+
+def build_products(ctx, table):
+    """Generate realistic product data"""
+    rng, ref = ctx.rng, ctx.reference_date
+    products_data = []
+    for i, product_name in enumerate(PRODUCT_NAMES):
+        product_id = i + 1
+        category_id = rng.choice([2, 3, 5, 6, 7, 8, 9])  # Random category
+        price = rng.choice(PRODUCT_PRICES)
+        cost = price * 0.6  # 40% margin
+        weight = round(rng.uniform(0.1, 5.0), 2)
+        dimensions = f"{rng.randint(10,50)}x{rng.randint(10,50)}x{rng.randint(5,20)} cm"
+        created_date = random_date(rng, ref - timedelta(days=2 * 365), ref)
+
+        products_data.append((
+            product_id, product_name, category_id, price, cost, weight,
+            dimensions, created_date, 1
+        ))
+    return ctx.insert(table, products_data)
+
+
+def build_customers(ctx, table):
+    """Generate realistic customer data"""
+    ctx.loader.load(table, ctx.insert_sql(table), 'generate_customers',
+                    ctx.row_counts['customers'], ctx.reference_date, ctx.names)
+    return ctx.row_counts['customers']
+
+
+def build_orders(ctx, table):
+    """Generate realistic order data"""
+    ctx.loader.load(table, ctx.insert_sql(table), 'generate_orders', ctx.row_counts['orders'],
+                    ctx.row_counts['customers'], ctx.reference_date, ctx.names)
+    return ctx.row_counts['orders']
+
+
+def build_order_items(ctx, table):
+    """Generate realistic order items data"""
+    product_prices = {product[0]: product[3] for product in ctx.rows['products']}  # product_id -> price
+    ctx.loader.load(table, ctx.insert_sql(table), 'generate_order_items',
+                    ctx.row_counts['orders'], product_prices)
+    return ctx.row_counts['order_items']
+
+
+def build_employees(ctx, table):
+    """Generate realistic employee data: 20 managers, then 180 regular employees
+
+    Every manager_id points at a lower employee_id, so the hierarchy is an
+    acyclic forest rooted at the executives (and employee 1).
+    """
+    rng, pool, ref = ctx.rng, ctx.pool, ctx.reference_date
+
+    # Create managers first
+    employees_data = []
+    for i in range(20):  # 20 managers
+        employee_id = i + 1
+        first_name = pool.pick(rng, 'first_name')
+        last_name = pool.pick(rng, 'last_name')
+        email = f"{first_name.lower()}.{last_name.lower()}{employee_id}@company.com"  # Unique even for repeated names
+        hire_date = random_date(rng, ref - timedelta(days=5 * 365), ref - timedelta(days=365))
+        department_id = rng.randint(1, 8)
+        job_title = rng.choice(['CEO', 'CTO', 'CFO', 'VP Sales', 'VP Marketing', 'VP Engineering',
+                                'Director', 'Manager'])
+        if job_title in ['CEO', 'CTO', 'CFO'] or employee_id == 1:
+            manager_id = None
+        else:
+            manager_id = rng.randint(1, employee_id - 1)  # Only earlier managers: no cycles
+        salary = round(rng.uniform(80000, 200000), 2)
+        commission_rate = round(rng.uniform(0, 0.1), 2) if 'Sales' in job_title else 0
+
+        employees_data.append((
+            employee_id, first_name, last_name, email, hire_date, department_id,
+            job_title, manager_id, salary, commission_rate, 1
+        ))
+
+    # Create regular employees
+    for i in range(180):  # 180 regular employees
+        employee_id = i + 21
+        first_name = pool.pick(rng, 'first_name')
+        last_name = pool.pick(rng, 'last_name')
+        email = f"{first_name.lower()}.{last_name.lower()}{employee_id}@company.com"  # Unique even for repeated names
+        hire_date = random_date(rng, ref - timedelta(days=3 * 365), ref)
+        department_id = rng.randint(1, 8)
+        job_title = rng.choice([j for j in JOB_TITLES if j not in ['CEO', 'CTO', 'CFO']])
+        manager_id = rng.randint(1, 20)  # Report to a manager
+        salary = round(rng.uniform(35000, 120000), 2)
+        commission_rate = round(rng.uniform(0, 0.05), 2) if 'Sales' in job_title else 0
+
+        employees_data.append((
+            employee_id, first_name, last_name, email, hire_date, department_id,
+            job_title, manager_id, salary, commission_rate, 1
+        ))
+    return ctx.insert(table, employees_data)
+
+
+def build_employee_hierarchy(ctx, table):
+    """Closure of employees.manager_id: one (ancestor, descendant, depth) row per pair
+
+    Every employee is its own ancestor at depth 0, its manager's descendant at
+    depth 1 and so on up to the root.
+    """
+    managers = {employee[0]: employee[7] for employee in ctx.rows['employees']}  # employee_id -> manager_id
+    hierarchy_data = []
+    for employee_id in managers:
+        ancestor_id, depth = employee_id, 0
+        while ancestor_id is not None:
+            if depth > len(managers):
+                raise ValueError(f"employees.manager_id has a cycle through employee {employee_id}")
+            hierarchy_data.append((ancestor_id, employee_id, depth))
+            ancestor_id, depth = managers[ancestor_id], depth + 1
+    return ctx.insert(table, hierarchy_data)
+
+
+def build_salaries(ctx, table):
+    """Generate 3 years of salary history per employee"""
+    rng = ctx.rng
+    salaries_data = []
+    for employee in ctx.rows['employees']:
+        employee_id = employee[0]
+        current_salary = employee[8]
+        hire_date = datetime.strptime(str(employee[4]), '%Y-%m-%d')
+
+        # Generate salary progression
+        salary_amount = current_salary * 0.7  # Start 30% lower
+        effective_date = hire_date
+
+        for year in range(3):  # 3 years of salary history
+            salary_id = len(salaries_data) + 1
+            end_date = effective_date + timedelta(days=365)
+
+            salaries_data.append((
+                salary_id, employee_id, round(salary_amount, 2),
+                effective_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+            ))
+
+            # Increase salary by 5-15% each year
+            salary_amount *= (1 + rng.uniform(0.05, 0.15))
+            effective_date = end_date
+    return ctx.insert(table, salaries_data)
+
+
+def build_sales_reps(ctx, table):
+    """Generate 50 sales reps spread over the territories"""
+    rng, ref = ctx.rng, ctx.reference_date
+    sales_reps_data = []
+    for i in range(50):  # 50 sales reps
+        rep_id = i + 1
+        rep_name = ctx.pool.pick(rng, 'name')
+        territory_id = rng.randint(1, 6)
+        hire_date = random_date(rng, ref - timedelta(days=2 * 365), ref)
+        commission_rate = round(rng.uniform(0.02, 0.08), 2)
+        quota = round(rng.uniform(500000, 2000000), 2)
+
+        sales_reps_data.append((
+            rep_id, rep_name, territory_id, hire_date, commission_rate, quota
+        ))
+    return ctx.insert(table, sales_reps_data)
+
+
+def build_sales(ctx, table):
+    """Generate daily sales data for the past 12 months, one partition per month"""
+    rep_commission_rates = {rep[0]: rep[4] for rep in ctx.rows['sales_reps']}  # rep_id -> commission_rate
+    partitions = ctx.generators.sales_partitions(ctx.row_counts['sales'], ctx.loader.table_seed(table))
+    ctx.loader.load_partitioned(table, ctx.insert_sql(table), partitions, 'generate_sales_partition',
+                                rep_commission_rates, len(ctx.rows['products']), ctx.reference_date)
+    return ctx.row_counts['sales']
+
+
+def build_monthly_revenue(ctx, table):
+    """Aggregate the loaded orders into monthly revenue (see sales_summaries.py)"""
+    return refresh_monthly_revenue(ctx.conn)
+
+
+def build_sales_summary(ctx, table):
+    """Aggregate the loaded sales into a summary table (see sales_summaries.py)"""
+    return refresh_summary(ctx.conn, table)
+
+
+def build_students(ctx, table):
+    """Generate 300 students; those with 120 credits have graduated"""
+    rng, pool, ref = ctx.rng, ctx.pool, ctx.reference_date
+    students_data = []
+    for i in range(300):  # 300 students
+        student_id = i + 1
+        first_name = pool.pick(rng, 'first_name')
+        last_name = pool.pick(rng, 'last_name')
+        email = f"{first_name.lower()}.{last_name.lower()}@university.edu"
+        dob = random_date(rng, ref - timedelta(days=25 * 365), ref - timedelta(days=18 * 365))
+        enrollment_date = random_date(rng, ref - timedelta(days=4 * 365), ref)
+        major = rng.choice(MAJORS)
+        gpa = round(rng.uniform(2.0, 4.0), 2)
+        credits_earned = rng.randint(0, 120)
+        graduation_date = None if credits_earned < 120 else random_date(rng, enrollment_date, ref)
+        is_active = 0 if graduation_date else 1
+
+        students_data.append((
+            student_id, first_name, last_name, email, dob, enrollment_date,
+            major, gpa, credits_earned, graduation_date, is_active
+        ))
+    return ctx.insert(table, students_data)
+
+
+def build_student_enrollments(ctx, table):
+    """Enroll every active student in 3-6 courses"""
+    rng = ctx.rng
+    enrollments_data = []
+    for student in ctx.rows['students']:
+        student_id = student[0]
+        if student[10]:  # If student is active
+            num_courses = rng.randint(3, 6)  # 3-6 courses per student
+
+            for course_num in range(num_courses):
+                enrollment_id = len(enrollments_data) + 1
+                course_id = rng.randint(1, 10)
+                enrollment_date = random_date(rng, student[5], ctx.reference_date)
+                grade = round(rng.uniform(2.0, 4.0), 2) if rng.random() > 0.1 else None
+                status = rng.choices(ENROLLMENT_STATUSES, weights=[10, 70, 5, 15])[0]
+
+                enrollments_data.append((
+                    enrollment_id, student_id, course_id, enrollment_date, grade, status
+                ))
+    return ctx.insert(table, enrollments_data)
+
+
+def build_financial_transactions(ctx, table):
+    """Generate financial transaction data"""
+    ctx.loader.load(table, ctx.insert_sql(table), 'generate_financial_transactions',
+                    ctx.row_counts['financial_transactions'], ctx.reference_date)
+    return ctx.row_counts['financial_transactions']
+
+
+def build_inventory_movements(ctx, table):
+    """Generate inventory movement data"""
+    ctx.loader.load(table, ctx.insert_sql(table), 'generate_inventory_movements',
+                    ctx.row_counts['inventory_movements'], len(ctx.rows['products']), ctx.reference_date)
+    return ctx.row_counts['inventory_movements']
+
+
+# =============================================================================
+# ENHANCED SCHEMA - TABLES
+# =============================================================================
+
+BUSINESS = '🏢 BUSINESS TABLES'
+HR = '👥 HR TABLES'
+SALES_FINANCE = '💰 SALES & FINANCE'
+EDUCATION = '🎓 EDUCATIONAL TABLES'
+OPERATIONS = '📦 OPERATIONS'
+SALES_SUMMARIES = '📈 SALES SUMMARIES'
+
+ENHANCED_TABLES = [
+    TableSpec('warehouses', '''
+    CREATE TABLE warehouses (
+        warehouse_id INTEGER PRIMARY KEY,
+        warehouse_name TEXT NOT NULL,
+        location TEXT NOT NULL,
+        capacity INTEGER,
+        manager_id INTEGER
+    )
+    ''', static_rows([
+        (1, 'Central Warehouse', 'New York', 10000, 101),
+        (2, 'West Coast Distribution', 'Los Angeles', 8000, 102),
+        (3, 'South Regional Center', 'Atlanta', 6000, 103),
+        (4, 'North Distribution Hub', 'Chicago', 7500, 104),
+        (5, 'East Coast Terminal', 'Boston', 5500, 105)
+    ]), group=BUSINESS),
+
+    TableSpec('categories', '''
+    CREATE TABLE categories (
+        category_id INTEGER PRIMARY KEY,
+        category_name TEXT NOT NULL,
+        parent_category_id INTEGER,
+        description TEXT,
+        category_path TEXT,
+        lft INTEGER,
+        rgt INTEGER,
+        depth INTEGER
+    )
+    ''', build_categories, indexes=[
+        'CREATE INDEX idx_categories_lft ON categories(lft, rgt)',
+        'CREATE INDEX idx_categories_path ON categories(category_path)',
+    ], group=BUSINESS),
+
+    TableSpec('products', '''
+    CREATE TABLE products (
+        product_id INTEGER PRIMARY KEY,
+        product_name TEXT NOT NULL,
+        category_id INTEGER,
+        price DECIMAL(10,2) NOT NULL,
+        cost DECIMAL(10,2),
+        weight_kg DECIMAL(5,2),
+        dimensions TEXT,
+        created_date DATE,
+        is_active BOOLEAN DEFAULT 1,
+        FOREIGN KEY (category_id) REFERENCES categories(category_id)
+    )
+    ''', build_products, depends_on=['categories'], indexes=[
+        'CREATE INDEX idx_products_category ON products(category_id)',
+        'CREATE INDEX idx_products_price ON products(price)',
+    ], group=BUSINESS),
+
+    TableSpec('customers', '''
+    CREATE TABLE customers (
+        customer_id INTEGER PRIMARY KEY,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        phone TEXT,
+        date_of_birth DATE,
+        registration_date DATE,
+        city TEXT,
+        state TEXT,
+        country TEXT DEFAULT 'USA',
+        customer_segment TEXT,
+        is_vip BOOLEAN DEFAULT 0,
+        total_spent DECIMAL(10,2) DEFAULT 0
+    )
+    ''', build_customers, indexes=[
+        'CREATE INDEX idx_customers_segment ON customers(customer_segment)',
+        'CREATE INDEX idx_customers_city ON customers(city)',
+    ], group=BUSINESS),
+
+    TableSpec('orders', '''
+    CREATE TABLE orders (
+        order_id INTEGER PRIMARY KEY,
+        customer_id INTEGER,
+        order_date DATE NOT NULL,
+        order_status TEXT,
+        shipping_address TEXT,
+        billing_address TEXT,
+        payment_method TEXT,
+        subtotal DECIMAL(10,2),
+        tax_amount DECIMAL(10,2),
+        shipping_cost DECIMAL(10,2),
+        total_amount DECIMAL(10,2),
+        warehouse_id INTEGER,
+        FOREIGN KEY (customer_id) REFERENCES customers(customer_id),
+        FOREIGN KEY (warehouse_id) REFERENCES warehouses(warehouse_id)
+    )
+    ''', build_orders, depends_on=['customers', 'warehouses'], indexes=[
+        'CREATE INDEX idx_orders_customer_date ON orders(customer_id, order_date)',
+        'CREATE INDEX idx_orders_date ON orders(order_date)',
+        'CREATE INDEX idx_orders_status ON orders(order_status)',
+    ], group=BUSINESS),
+
+    TableSpec('order_items', '''
+    CREATE TABLE order_items (
+        order_item_id INTEGER PRIMARY KEY,
+        order_id INTEGER,
+        product_id INTEGER,
+        quantity INTEGER NOT NULL,
+        unit_price DECIMAL(10,2),
+        total_price DECIMAL(10,2),
+        FOREIGN KEY (order_id) REFERENCES orders(order_id),
+        FOREIGN KEY (product_id) REFERENCES products(product_id)
+    )
+    ''', build_order_items, depends_on=['orders', 'products'], indexes=[
+        'CREATE INDEX idx_order_items_order ON order_items(order_id)',
+        'CREATE INDEX idx_order_items_product ON order_items(product_id)',
+    ], group=BUSINESS),
+
+    TableSpec('departments', '''
+    CREATE TABLE departments (
+        department_id INTEGER PRIMARY KEY,
+        department_name TEXT NOT NULL,
+        manager_id INTEGER,
+        budget DECIMAL(12,2),
+        location TEXT,
+        established_date DATE
+    )
+    ''', static_rows([
+        (1, 'Executive', None, 5000000, 'Corporate HQ', '2020-01-01'),
+        (2, 'Sales', 101, 2000000, 'Sales Office', '2020-01-01'),
+        (3, 'Marketing', 102, 1500000, 'Marketing Office', '2020-02-01'),
+        (4, 'Engineering', 103, 8000000, 'Tech Center', '2020-01-15'),
+        (5, 'Human Resources', 104, 800000, 'HR Office', '2020-03-01'),
+        (6, 'Finance', 105, 1200000, 'Finance Office', '2020-01-01'),
+        (7, 'Operations', 106, 3000000, 'Operations Center', '2020-02-15'),
+        (8, 'Customer Service', 107, 1000000, 'Support Center', '2020-04-01')
+    ]), group=HR),
+
+    TableSpec('employees', '''
+    CREATE TABLE employees (
+        employee_id INTEGER PRIMARY KEY,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT UNIQUE,
+        hire_date DATE,
+        department_id INTEGER,
+        job_title TEXT,
+        manager_id INTEGER,
+        salary DECIMAL(10,2),
+        commission_rate DECIMAL(5,2),
+        is_active BOOLEAN DEFAULT 1,
+        FOREIGN KEY (department_id) REFERENCES departments(department_id),
+        FOREIGN KEY (manager_id) REFERENCES employees(employee_id)
+    )
+    ''', build_employees, depends_on=['departments'], indexes=[
+        'CREATE INDEX idx_employees_department ON employees(department_id)',
+        'CREATE INDEX idx_employees_manager ON employees(manager_id)',
+    ], group=HR),
+
+    TableSpec('employee_hierarchy', '''
+    CREATE TABLE employee_hierarchy (
+        ancestor_id INTEGER NOT NULL,
+        descendant_id INTEGER NOT NULL,
+        depth INTEGER NOT NULL,
+        PRIMARY KEY (ancestor_id, descendant_id),
+        FOREIGN KEY (ancestor_id) REFERENCES employees(employee_id),
+        FOREIGN KEY (descendant_id) REFERENCES employees(employee_id)
+    ) WITHOUT ROWID
+    ''', build_employee_hierarchy, depends_on=['employees'], indexes=[
+        'CREATE INDEX idx_hierarchy_ancestor_depth ON employee_hierarchy(ancestor_id, depth)',
+        'CREATE INDEX idx_hierarchy_descendant_depth ON employee_hierarchy(descendant_id, depth)',
+    ], group=HR),
+
+    TableSpec('salaries', '''
+    CREATE TABLE salaries (
+        salary_id INTEGER PRIMARY KEY,
+        employee_id INTEGER,
+        salary_amount DECIMAL(10,2),
+        effective_date DATE,
+        end_date DATE,
+        FOREIGN KEY (employee_id) REFERENCES employees(employee_id)
+    )
+    ''', build_salaries, depends_on=['employees'], indexes=[
+        'CREATE INDEX idx_salaries_employee ON salaries(employee_id)',
+        'CREATE INDEX idx_salaries_date ON salaries(effective_date)',
+    ], group=HR),
+
+    TableSpec('sales_territories', '''
+    CREATE TABLE sales_territories (
+        territory_id INTEGER PRIMARY KEY,
+        territory_name TEXT NOT NULL,
+        region TEXT,
+        sales_rep_id INTEGER,
+        target_revenue DECIMAL(12,2)
+    )
+    ''', static_rows([
+        (1, 'Northeast', 'East Coast', 101, 5000000),
+        (2, 'Southeast', 'East Coast', 102, 4500000),
+        (3, 'Midwest', 'Central', 103, 6000000),
+        (4, 'Southwest', 'West Coast', 104, 4000000),
+        (5, 'West Coast', 'West Coast', 105, 7000000),
+        (6, 'Northwest', 'West Coast', 106, 3500000)
+    ]), group=SALES_FINANCE),
+
+    TableSpec('sales_reps', '''
+    CREATE TABLE sales_reps (
+        rep_id INTEGER PRIMARY KEY,
+        rep_name TEXT NOT NULL,
+        territory_id INTEGER,
+        hire_date DATE,
+        commission_rate DECIMAL(5,2),
+        quota DECIMAL(10,2),
+        FOREIGN KEY (territory_id) REFERENCES sales_territories(territory_id)
+    )
+    ''', build_sales_reps, depends_on=['sales_territories'], group=SALES_FINANCE),
+
+    TableSpec('sales', '''
+    CREATE TABLE sales (
+        sale_id INTEGER PRIMARY KEY,
+        rep_id INTEGER,
+        territory_id INTEGER,
+        sale_date DATE,
+        product_id INTEGER,
+        quantity INTEGER,
+        unit_price DECIMAL(10,2),
+        total_amount DECIMAL(10,2),
+        commission_earned DECIMAL(10,2),
+        FOREIGN KEY (rep_id) REFERENCES sales_reps(rep_id),
+        FOREIGN KEY (territory_id) REFERENCES sales_territories(territory_id),
+        FOREIGN KEY (product_id) REFERENCES products(product_id)
+    )
+    ''', build_sales, depends_on=['sales_reps', 'sales_territories', 'products'], indexes=[
+        'CREATE INDEX idx_sales_rep_date ON sales(rep_id, sale_date)',
+        'CREATE INDEX idx_sales_date ON sales(sale_date)',
+        'CREATE INDEX idx_sales_territory ON sales(territory_id)',
+    ], group=SALES_FINANCE),
+
+    TableSpec('monthly_revenue', '''
+    CREATE TABLE monthly_revenue (
+        month_id INTEGER PRIMARY KEY,
+        year INTEGER,
+        month INTEGER,
+        revenue DECIMAL(12,2),
+        expenses DECIMAL(12,2),
+        profit DECIMAL(12,2),
+        customer_count INTEGER,
+        order_count INTEGER
+    )
+    ''', build_monthly_revenue, depends_on=['orders', 'order_items', 'products'],
+              group=SALES_FINANCE, derived=True),
+
+    TableSpec('students', '''
+    CREATE TABLE students (
+        student_id INTEGER PRIMARY KEY,
+        first_name TEXT NOT NULL,
+        last_name TEXT NOT NULL,
+        email TEXT,
+        date_of_birth DATE,
+        enrollment_date DATE,
+        major TEXT,
+        gpa DECIMAL(3,2),
+        credits_earned INTEGER,
+        graduation_date DATE,
+        is_active BOOLEAN DEFAULT 1
+    )
+    ''', build_students, group=EDUCATION),
+
+    TableSpec('courses', '''
+    CREATE TABLE courses (
+        course_id INTEGER PRIMARY KEY,
+        course_name TEXT NOT NULL,
+        department TEXT,
+        credits INTEGER,
+        instructor TEXT,
+        semester TEXT,
+        year INTEGER,
+        max_enrollment INTEGER,
+        current_enrollment INTEGER
+    )
+    ''', static_rows([
+        (1, 'Introduction to Programming', 'Computer Science', 3, 'Dr. Smith', 'Fall', 2024, 30, 28),
+        (2, 'Data Structures', 'Computer Science', 4, 'Dr. Johnson', 'Fall', 2024, 25, 24),
+        (3, 'Database Systems', 'Computer Science', 3, 'Dr. Williams', 'Spring', 2024, 35, 32),
+        (4, 'Machine Learning', 'Computer Science', 4, 'Dr. Brown', 'Fall', 2024, 20, 18),
+        (5, 'Calculus I', 'Mathematics', 4, 'Dr. Davis', 'Fall', 2024, 40, 38),
+        (6, 'Calculus II', 'Mathematics', 4, 'Dr. Miller', 'Spring', 2024, 35, 33),
+        (7, 'Linear Algebra', 'Mathematics', 3, 'Dr. Wilson', 'Fall', 2024, 30, 29),
+        (8, 'Introduction to Business', 'Business', 3, 'Dr. Moore', 'Fall', 2024, 50, 47),
+        (9, 'Financial Accounting', 'Business', 3, 'Dr. Taylor', 'Spring', 2024, 40, 39),
+        (10, 'Marketing Principles', 'Business', 3, 'Dr. Anderson', 'Fall', 2024, 45, 42)
+    ]), group=EDUCATION),
+
+    TableSpec('student_enrollments', '''
+    CREATE TABLE student_enrollments (
+        enrollment_id INTEGER PRIMARY KEY,
+        student_id INTEGER,
+        course_id INTEGER,
+        enrollment_date DATE,
+        grade DECIMAL(3,2),
+        status TEXT,
+        FOREIGN KEY (student_id) REFERENCES students(student_id),
+        FOREIGN KEY (course_id) REFERENCES courses(course_id)
+    )
+    ''', build_student_enrollments, depends_on=['students', 'courses'], group=EDUCATION),
+
+    TableSpec('accounts', '''
+    CREATE TABLE accounts (
+        account_id INTEGER PRIMARY KEY,
+        account_name TEXT NOT NULL,
+        account_type TEXT,
+        balance DECIMAL(12,2),
+        currency TEXT DEFAULT 'USD',
+        is_active BOOLEAN DEFAULT 1,
+        created_date DATE
+    )
+    ''', static_rows([
+        (1, 'Cash', 'Asset', 500000, 'USD', 1, '2020-01-01'),
+        (2, 'Accounts Receivable', 'Asset', 750000, 'USD', 1, '2020-01-01'),
+        (3, 'Inventory', 'Asset', 1200000, 'USD', 1, '2020-01-01'),
+        (4, 'Equipment', 'Asset', 2000000, 'USD', 1, '2020-01-01'),
+        (5, 'Accounts Payable', 'Liability', 300000, 'USD', 1, '2020-01-01'),
+        (6, 'Loans Payable', 'Liability', 800000, 'USD', 1, '2020-01-01'),
+        (7, 'Equity', 'Equity', 3350000, 'USD', 1, '2020-01-01'),
+        (8, 'Revenue', 'Revenue', 0, 'USD', 1, '2020-01-01'),
+        (9, 'Cost of Sales', 'Expense', 0, 'USD', 1, '2020-01-01'),
+        (10, 'Operating Expenses', 'Expense', 0, 'USD', 1, '2020-01-01')
+    ]), group=SALES_FINANCE),
+
+    TableSpec('financial_transactions', '''
+    CREATE TABLE financial_transactions (
+        transaction_id INTEGER PRIMARY KEY,
+        account_id INTEGER,
+        transaction_date DATE,
+        description TEXT,
+        debit_amount DECIMAL(12,2),
+        credit_amount DECIMAL(12,2),
+        reference_number TEXT,
+        FOREIGN KEY (account_id) REFERENCES accounts(account_id)
+    )
+    ''', build_financial_transactions, depends_on=['accounts'], indexes=[
+        'CREATE INDEX idx_financial_account ON financial_transactions(account_id)',
+        'CREATE INDEX idx_financial_date ON financial_transactions(transaction_date)',
+    ], group=SALES_FINANCE),
+
+    TableSpec('inventory_movements', '''
+    CREATE TABLE inventory_movements (
+        movement_id INTEGER PRIMARY KEY,
+        product_id INTEGER,
+        warehouse_id INTEGER,
+        movement_type TEXT,
+        quantity INTEGER,
+        movement_date DATE,
+        reference_number TEXT,
+        FOREIGN KEY (product_id) REFERENCES products(product_id),
+        FOREIGN KEY (warehouse_id) REFERENCES warehouses(warehouse_id)
+    )
+    ''', build_inventory_movements, depends_on=['products', 'warehouses'], indexes=[
+        'CREATE INDEX idx_inventory_product ON inventory_movements(product_id)',
+        'CREATE INDEX idx_inventory_warehouse ON inventory_movements(warehouse_id)',
+    ], group=OPERATIONS),
+] + [
+    TableSpec(table, summary_ddl(table), build_sales_summary, depends_on=['sales'],
+              group=SALES_SUMMARIES, derived=True)
+    for table in SUMMARY_TABLES
+]
+
+
+# =============================================================================
+# EXERCISE SCHEMA (small fixed tables used by the SQL exercises)
+# =============================================================================
+
+EXERCISE_TABLES = [
+    TableSpec('employees', '''
+    CREATE TABLE employees (
+        emp_id INTEGER PRIMARY KEY,
+        emp_name TEXT NOT NULL,
+        job_name TEXT,
+        manager_id INTEGER,
+        start_date DATE,
+        salary REAL,
+        commission REAL,
+        dep_id INTEGER
+    )
+    ''', static_rows([
+        (68319, 'KAYLING', 'PRESIDENT', None, '1991-11-18', 6000.00, None, 1001),
+        (66928, 'BLAZE', 'MANAGER', 68319, '1991-05-01', 2750.00, None, 3001),
+        (67832, 'CLARE', 'MANAGER', 68319, '1991-06-09', 2550.00, None, 1001),
+        (65646, 'JONAS', 'MANAGER', 68319, '1991-04-02', 2957.00, None, 2001),
+        (67858, 'SCARLET', 'ANALYST', 65646, '1997-04-19', 3100.00, None, 2001),
+        (69062, 'FRANK', 'ANALYST', 65646, '1991-12-03', 3100.00, None, 2001),
+        (63679, 'SANDRINE', 'CLERK', 69062, '1990-12-18', 900.00, None, 2001),
+    ])),
+
+    TableSpec('departments', '''
+    CREATE TABLE departments (
+        department_id INTEGER PRIMARY KEY,
+        department_name TEXT NOT NULL
+    )
+    ''', static_rows([
+        (1001, 'Executive'),
+        (2001, 'Analytics'),
+        (3001, 'Operations'),
+    ])),
+
+    TableSpec('orders', '''
+    CREATE TABLE orders (
+        cid TEXT,
+        order_id TEXT PRIMARY KEY,
+        order_date DATE,
+        order_value REAL
+    )
+    ''', static_rows([
+        ('A', 'qwerty', '2024-01-01', 10),
+        ('A', 'asdfgh', '2024-01-03', 20),
+        ('A', 'zxcvbn', '2024-01-10', 30),
+        ('B', 'uiopyy', '2024-01-02', 40),
+        ('B', 'lkjhgf', '2024-01-06', 50),
+        ('B', 'mnbvcx', '2024-01-08', 60),
+        ('B', 'rtyfgh', '2024-01-10', 70),
+        ('C', 'fghcvb', '2024-02-01', 80),
+        ('C', 'bnmghj', '2024-02-01', 90),
+        ('C', 'wersdf', '2024-02-03', 100),
+        ('C', 'asdzxc', '2024-02-04', 110),
+    ])),
+
+    TableSpec('employee', '''
+    CREATE TABLE employee (
+        id INTEGER PRIMARY KEY,
+        name TEXT,
+        department TEXT,
+        managerId INTEGER
+    )
+    ''', static_rows([
+        (101, 'John', 'A', None),
+        (102, 'Dan', 'A', 101),
+        (103, 'James', 'A', 101),
+        (104, 'Amy', 'A', 101),
+        (105, 'Anne', 'A', 101),
+        (106, 'Ron', 'B', 101),
+    ])),
+
+    TableSpec('employee_salary', '''
+    CREATE TABLE employee_salary (
+        empId INTEGER PRIMARY KEY,
+        name TEXT,
+        supervisor INTEGER,
+        salary REAL
+    )
+    ''', static_rows([
+        (3, 'Brad', None, 4000),
+        (1, 'John', 3, 1000),
+        (2, 'Dan', 3, 2000),
+        (4, 'Thomas', 3, 4000),
+    ])),
+
+    TableSpec('bonus', '''
+    CREATE TABLE bonus (
+        empId INTEGER PRIMARY KEY,
+        bonus REAL
+    )
+    ''', static_rows([
+        (2, 500),
+        (4, 2000),
+    ]), depends_on=['employee_salary']),
+
+    TableSpec('courses', '''
+    CREATE TABLE courses (
+        student TEXT,
+        class TEXT
+    )
+    ''', static_rows([
+        ('A', 'Math'),
+        ('B', 'English'),
+        ('C', 'Math'),
+        ('D', 'Biology'),
+        ('E', 'Math'),
+        ('F', 'Computer'),
+        ('G', 'Math'),
+        ('H', 'Math'),
+        ('I', 'Math'),
+    ])),
+
+    TableSpec('sales', '''
+    CREATE TABLE sales (
+        sale_id INTEGER PRIMARY KEY,
+        product_id INTEGER,
+        year INTEGER,
+        quantity INTEGER,
+        price REAL
+    )
+    ''', static_rows([
+        (1, 100, 2008, 10, 5000),
+        (2, 100, 2009, 12, 5000),
+        (7, 200, 2011, 15, 9000),
+    ])),
+
+    TableSpec('products', '''
+    CREATE TABLE products (
+        product_id INTEGER PRIMARY KEY,
+        product_name TEXT
+    )
+    ''', static_rows([
+        (100, 'Nokia'),
+        (200, 'Apple'),
+        (300, 'Samsung'),
+    ])),
+
+    TableSpec('students', '''
+    CREATE TABLE students (
+        student_id INTEGER PRIMARY KEY,
+        name TEXT,
+        age INTEGER
+    )
+    ''', static_rows([
+        (101, 'Ulysses', 13),
+        (53, 'William', 10),
+        (128, 'Henry', 6),
+        (3, 'Henry', 11),
+    ])),
+]
+
+
+# =============================================================================
+# PROFILES
+# =============================================================================
+
+PROFILES = {
+    'enhanced': {
+        'title': 'Enhanced EPAM Practice Database',
+        'tables': ENHANCED_TABLES,
+        'names': 'faker',
+    },
+    'stdlib': {
+        'title': 'Enhanced EPAM Practice Database (standard library only)',
+        'tables': ENHANCED_TABLES,
+        'names': 'stdlib',
+    },
+    'exercises': {
+        'title': 'EPAM Practice Database (exercise tables)',
+        'tables': EXERCISE_TABLES,
+        'names': 'stdlib',
+    },
+}
@@ -0,0 +1,251 @@
+"""
+EPAM Practice Database - SQL Module Benchmark
+Runs the ```sql examples of the course modules against epam_practice.db.
+
+Every fenced ```sql block in 01_SQL/*.md and 01_SQL/solutions/*.md is split
+into statements. Blocks made only of queries (SELECT, WITH, VALUES, EXPLAIN)
+are run on a read-only connection; blocks that create or change anything are
+listed as skipped, and blocks written for another dialect or for tables the
+practice database does not have are recorded with their error. Each runnable
+block gets its wall time, the number of rows it returned and the peak Python
+memory (tracemalloc) used to fetch them; the process high-water RSS is stored
+for the whole run. The results file is keyed by a hash of the SQL text, so
+two runs (before and after a schema or index change) can be compared with
+--baseline.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sqlite3
+import statistics
+import time
+import tracemalloc
+from build_phases import max_rss_kb
+from db_connection import DEFAULT_DB_PATH, connect, exists
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_GLOBS = [
+    os.path.join('01_SQL', '*.md'),
+    os.path.join('01_SQL', 'solutions', '*.md'),
+]
+READ_ONLY_KEYWORDS = ('SELECT', 'WITH', 'VALUES', 'EXPLAIN')
+
+# Queries running longer than this are interrupted (e.g. accidental cross joins at a big scale)
+DEFAULT_TIMEOUT = 30.0
+# A query is reported as a regression when it is this much slower than the baseline
+REGRESSION_RATIO = 1.5
+# ...and slower than this; sub-millisecond timings are mostly noise
+MIN_REGRESSION_MS = 1.0
+
+
+def extract_sql_blocks(paths):
+    """Yield {'id', 'file', 'line', 'sql'} for every ```sql block in the files"""
+    for path in paths:
+        relpath = os.path.relpath(path, REPO_DIR).replace(os.sep, '/')
+        block, start = None, None
+        with open(path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                fence = line.strip()
+                if block is None and fence.lower() == '```sql':
+                    block, start = [], line_number
+                elif block is not None and fence == '```':
+                    sql = ''.join(block).strip()
+                    if sql:
+                        yield {'id': f'{relpath}:{start}', 'file': relpath, 'line': start, 'sql': sql}
+                    block = None
+                elif block is not None:
+                    block.append(line)
+
+
+def split_statements(sql):
+    """Split a block into complete statements (comments stay with their statement)"""
+    statements, current = [], ''
+    for line in sql.splitlines(keepends=True):
+        current += line
+        if sqlite3.complete_statement(current):
+            statements.append(current.strip())
+            current = ''
+    if current.strip() and not _only_comments(current):
+        statements.append(current.strip())  # trailing statement without a semicolon
+    return statements
+
+
+def _only_comments(sql):
+    return all(not line.strip() or line.strip().startswith('--') for line in sql.splitlines())
+
+
+def _first_keyword(statement):
+    for line in statement.splitlines():
+        line = line.strip()
+        if line and not line.startswith('--'):
+            return line.split()[0].lstrip('(').upper()
+    return ''
+
+
+def is_read_only(statements):
+    """True when every statement of a block only reads"""
+    return bool(statements) and all(
+        _first_keyword(statement).startswith(READ_ONLY_KEYWORDS) for statement in statements
+    )
+
+
+def run_block(conn, statements, timeout=DEFAULT_TIMEOUT):
+    """Run a block once: (wall_ms, rows, peak_python_kb)"""
+    deadline = time.perf_counter() + timeout
+    conn.set_progress_handler(lambda: time.perf_counter() > deadline, 10000)
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = 0
+    try:
+        for statement in statements:
+            cursor = conn.execute(statement)
+            for _ in cursor:
+                rows += 1
+        wall_ms = (time.perf_counter() - start) * 1000
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        conn.set_progress_handler(None, 0)
+    return wall_ms, rows, peak / 1024
+
+
+def benchmark(db_path, blocks, repeat=1, timeout=DEFAULT_TIMEOUT):
+    """Run every read-only block `repeat` times; one result dict per block"""
+    conn = connect(db_path, read_only=True)
+    results = []
+    try:
+        for block in blocks:
+            statements = split_statements(block['sql'])
+            result = {
+                'id': block['id'],
+                'file': block['file'],
+                'line': block['line'],
+                'sql_hash': hashlib.sha1(block['sql'].encode()).hexdigest()[:16],
+                'statements': len(statements),
+            }
+            if not is_read_only(statements):
+                result['status'] = 'skipped'
+                results.append(result)
+                continue
+
+            try:
+                runs = [run_block(conn, statements, timeout) for _ in range(repeat)]
+            except sqlite3.Error as e:
+                interrupted = 'interrupted' in str(e)
+                result['status'] = 'timeout' if interrupted else 'error'
+                result['error'] = str(e)
+            else:
+                wall_times = [wall_ms for wall_ms, _, _ in runs]
+                result.update({
+                    'status': 'ok',
+                    'wall_ms': round(min(wall_times), 3),
+                    'wall_ms_median': round(statistics.median(wall_times), 3),
+                    'rows': runs[0][1],
+                    'peak_python_kb': round(max(peak for _, _, peak in runs), 1),
+                })
+            results.append(result)
+    finally:
+        conn.close()
+    return results
+
+
+def table_row_counts(db_path):
+    """Row count of every table, stored with the results for context"""
+    conn = connect(db_path, read_only=True)
+    try:
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )]
+        return {table: conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0] for table in tables}
+    finally:
+        conn.close()
+
+
+def compare(results, baseline, ratio=REGRESSION_RATIO):
+    """(result, baseline_ms) pairs of queries at least `ratio` times slower than the baseline"""
+    previous = {
+        result['sql_hash']: result['wall_ms']
+        for result in baseline['results'] if result.get('status') == 'ok'
+    }
+    return [
+        (result, previous[result['sql_hash']])
+        for result in results
+        if result.get('status') == 'ok' and result['sql_hash'] in previous
+        and result['wall_ms'] >= ratio * previous[result['sql_hash']] and result['wall_ms'] > MIN_REGRESSION_MS
+    ]
+
+
+def print_summary(results, top=10):
+    """Status counts and the slowest queries"""
+    by_status = {}
+    for result in results:
+        by_status[result['status']] = by_status.get(result['status'], 0) + 1
+    print("📊 " + ", ".join(f"{status}: {count}" for status, count in sorted(by_status.items())))
+
+    slowest = sorted((r for r in results if r['status'] == 'ok'), key=lambda r: r['wall_ms'], reverse=True)
+    print(f"\n🐢 Slowest {min(top, len(slowest))} queries:")
+    print("   Block                                                        |   Wall ms |     Rows |  Peak KB")
+    print("   -------------------------------------------------------------|-----------|----------|---------")
+    for result in slowest[:top]:
+        print(f"   {result['id'][:60]:60} | {result['wall_ms']:9.2f} | {result['rows']:8,} | {result['peak_python_kb']:8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the SQL examples of the course modules")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="database to query (opened read-only)")
+    parser.add_argument('--scale-factor', type=float,
+                        help="first (re)build the --db database at this scale factor")
+    parser.add_argument('--seed', type=int, default=42, help="seed used with --scale-factor")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per block; the fastest is reported")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help="seconds before a query is interrupted")
+    parser.add_argument('--match', help="only blocks whose id contains this text")
+    parser.add_argument('--top', type=int, default=10, help="slowest queries to list")
+    parser.add_argument('--output', default='sql_benchmark.json', help="results file (JSON)")
+    parser.add_argument('--baseline', help="earlier results file to compare against")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("⏱️  SQL MODULE BENCHMARK")
+    print("="*70)
+
+    if args.scale_factor:
+        from enhanced_database_setup import create_enhanced_database
+        create_enhanced_database(scale_factor=args.scale_factor, seed=args.seed, db_path=args.db)
+    if not exists(args.db):
+        parser.error(f"{args.db} not found; run enhanced_database_setup.py or pass --scale-factor")
+
+    paths = sorted(path for pattern in MODULE_GLOBS for path in glob.glob(os.path.join(REPO_DIR, pattern)))
+    blocks = [block for block in extract_sql_blocks(paths) if not args.match or args.match in block['id']]
+    print(f"🔎 {len(blocks)} SQL blocks in {len(paths)} files, running against {args.db}")
+
+    rss_before = max_rss_kb()
+    results = benchmark(args.db, blocks, args.repeat, args.timeout)
+    print_summary(results, args.top)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'sqlite_version': sqlite3.sqlite_version,
+        'db': os.path.abspath(args.db),
+        'scale_factor': args.scale_factor,
+        'repeat': args.repeat,
+        'max_rss_kb': max_rss_kb(),
+        'max_rss_growth_kb': None if rss_before is None else max_rss_kb() - rss_before,
+        'row_counts': table_row_counts(args.db),
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f))
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} queries at least {REGRESSION_RATIO}x slower than {args.baseline}:")
+            for result, baseline_ms in regressions:
+                print(f"   {result['id']}: {baseline_ms:.2f} ms -> {result['wall_ms']:.2f} ms")
+        else:
+            print(f"\n✅ No query is {REGRESSION_RATIO}x slower than {args.baseline}")
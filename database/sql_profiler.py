@@ -0,0 +1,165 @@
+"""
+EPAM Practice Database - Statement Profiler
+Per-statement counts, latency and SQLite VM steps for the practice connections.
+
+db_connection.connect(..., profiler=StatementProfiler()) opens a
+ProfiledConnection: its cursors time every execute()/executemany() and the
+fetches that follow, keyed by the statement text with whitespace collapsed.
+A progress handler counts virtual machine steps (in blocks of
+PROGRESS_STEPS) for the statement running at the time, so a statement that
+is cheap per call but runs thousands of times stands out as clearly as one
+slow scan. print_report() lists the top statements by total time:
+
+    profiler = StatementProfiler()
+    conn = db_connection.connect('epam_practice.db', profiler=profiler)
+    ...
+    profiler.print_report(top=10)
+
+db_connection.enable_profiling() does the same for every connection the
+scripts open and prints the report when the process exits.
+"""
+
+import sqlite3
+import time
+
+# VM instructions between two progress handler calls
+PROGRESS_STEPS = 1000
+# Characters of the statement shown in the report
+REPORT_SQL_WIDTH = 58
+
+
+def statement_key(sql):
+    """Statement text with its whitespace collapsed, the aggregation key"""
+    return ' '.join(sql.split())
+
+
+class StatementProfiler:
+    """Aggregated statistics of every statement run on the profiled connections"""
+
+    def __init__(self):
+        self.stats = {}
+        self.current = None  # statement the VM steps are counted for
+
+    def _entry(self, key):
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = {'calls': 0, 'executions': 0, 'total_ms': 0.0,
+                                       'vm_steps': 0, 'rows': 0}
+        return entry
+
+    def record(self, key, elapsed_ms, calls=0, executions=0, rows=0):
+        entry = self._entry(key)
+        entry['calls'] += calls
+        entry['executions'] += executions
+        entry['total_ms'] += elapsed_ms
+        entry['rows'] += rows
+
+    def progress(self):
+        """Progress handler: charge PROGRESS_STEPS VM steps to the running statement"""
+        if self.current is not None:
+            self._entry(self.current)['vm_steps'] += PROGRESS_STEPS
+        return 0  # never interrupt
+
+    def install(self, conn):
+        """Count VM steps on conn (replaces any other progress handler)"""
+        conn.set_progress_handler(self.progress, PROGRESS_STEPS)
+
+    def top(self, n=10):
+        """[(statement, stats)] with the largest total time first; stats include mean_ms"""
+        ranked = sorted(self.stats.items(), key=lambda item: item[1]['total_ms'], reverse=True)
+        return [
+            (key, dict(entry, mean_ms=entry['total_ms'] / max(entry['executions'], 1)))
+            for key, entry in ranked[:n]
+        ]
+
+    def print_report(self, top=10):
+        """Console table of the top statements by total time"""
+        total_ms = sum(entry['total_ms'] for entry in self.stats.values())
+        print("\n" + "="*70)
+        print(f"🔬 SQL PROFILE: top {min(top, len(self.stats))} of {len(self.stats)} statements, "
+              f"{total_ms / 1000:.2f}s in SQLite")
+        print("="*70)
+        print(f"   {'Statement':{REPORT_SQL_WIDTH}} |   Execs | Total ms | Mean ms | VM steps |    Rows")
+        print(f"   {'-' * REPORT_SQL_WIDTH}-|---------|----------|---------|----------|--------")
+        for key, entry in self.top(top):
+            sql = key if len(key) <= REPORT_SQL_WIDTH else key[:REPORT_SQL_WIDTH - 3] + '...'
+            print(f"   {sql:{REPORT_SQL_WIDTH}} | {entry['executions']:7,} | {entry['total_ms']:8.1f} | "
+                  f"{entry['mean_ms']:7.3f} | {entry['vm_steps']:8,} | {entry['rows']:7,}")
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that reports its statements and fetches to connection.profiler"""
+
+    def _timed(self, key, call, *args, executions=0):
+        profiler = self.connection.profiler
+        profiler.current = key
+        start = time.perf_counter()
+        try:
+            return call(*args)
+        finally:
+            profiler.record(key, (time.perf_counter() - start) * 1000, calls=1, executions=executions)
+
+    def execute(self, sql, parameters=()):
+        self._profile_key = key = statement_key(sql)
+        cursor = self._timed(key, super().execute, sql, parameters, executions=1)
+        if self.description is None and self.rowcount > 0:  # rows changed by DML
+            self.connection.profiler.record(key, 0, rows=self.rowcount)
+        return cursor
+
+    def executemany(self, sql, seq_of_parameters):
+        self._profile_key = key = statement_key(sql)
+        executions = [0]
+
+        def counted(rows):
+            for row in rows:
+                executions[0] += 1
+                yield row
+
+        cursor = self._timed(key, super().executemany, sql, counted(seq_of_parameters))
+        self.connection.profiler.record(key, 0, executions=executions[0], rows=max(self.rowcount, 0))
+        return cursor
+
+    def _fetch(self, call, *args):
+        key = getattr(self, '_profile_key', None)
+        if key is None:
+            return call(*args)
+        profiler = self.connection.profiler
+        profiler.current = key
+        start = time.perf_counter()
+        rows = call(*args)
+        profiler.record(key, (time.perf_counter() - start) * 1000, rows=len(rows))
+        return rows
+
+    def fetchone(self):
+        rows = self._fetch(super().fetchmany, 1)
+        return rows[0] if rows else None
+
+    def fetchmany(self, size=None):
+        return self._fetch(super().fetchmany, self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._fetch(super().fetchall)
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose cursors (including conn.execute) are ProfiledCursors
+
+    Set .profiler before use; db_connection.connect() does that.
+    """
+
+    profiler = None
+
+    def cursor(self, factory=ProfiledCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
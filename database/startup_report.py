@@ -0,0 +1,111 @@
+"""
+EPAM Practice Database - Startup Import Report
+Measures how long the setup scripts take to import, using `python -X importtime`.
+
+Every module is imported in a fresh interpreter a few times and the fastest
+run is kept, so the number reflects the import cost rather than a cold disk
+cache. The report lists the total per script and the slowest modules it pulls
+in. --json writes the report for tooling and --history appends one line per
+run, so the cold-start cost can be tracked over time.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+DATABASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SETUP_MODULES = [
+    'enhanced_database_setup',
+    'enhanced_database_setup_fixed',
+    'enhanced_database_setup_simple',
+    'setup_database',
+]
+
+
+def parse_importtime(stderr):
+    """Turn -X importtime output into (module, level, self_us, cumulative_us) rows"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), level, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure_import(module, runs=5):
+    """Fastest of `runs` fresh-interpreter imports of module: (total_us, rows)"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=DATABASE_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"importing {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+        rows = parse_importtime(result.stderr)
+        total_us = sum(cumulative_us for _, level, _, cumulative_us in rows if level == 0)
+        if best is None or total_us < best[0]:
+            best = (total_us, rows)
+    return best
+
+
+def build_report(modules=SETUP_MODULES, runs=5, top=10):
+    """Import cost of every module plus its `top` slowest imports (by self time)"""
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'runs': runs,
+        'modules': {},
+    }
+    for module in modules:
+        total_us, rows = measure_import(module, runs)
+        slowest = sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+        report['modules'][module] = {
+            'total_ms': round(total_us / 1000, 1),
+            'slowest': [
+                {'module': name, 'self_ms': round(self_us / 1000, 1), 'cumulative_ms': round(cumulative_us / 1000, 1)}
+                for name, _, self_us, cumulative_us in slowest
+            ],
+        }
+    return report
+
+
+def print_report(report):
+    """Console table of the report"""
+    for module, stats in report['modules'].items():
+        print(f"\n📦 {module}: {stats['total_ms']:.1f} ms")
+        print("   Module                                   |  Self ms | Cumulative ms")
+        print("   -----------------------------------------|----------|--------------")
+        for row in stats['slowest']:
+            print(f"   {row['module'][:40]:40} | {row['self_ms']:8.1f} | {row['cumulative_ms']:13.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report the import (cold-start) time of the setup scripts")
+    parser.add_argument('modules', nargs='*', default=SETUP_MODULES,
+                        help="modules in database/ to import (default: the setup scripts)")
+    parser.add_argument('--runs', type=int, default=5, help="imports per module, the fastest is kept")
+    parser.add_argument('--top', type=int, default=10, help="slowest imported modules to list")
+    parser.add_argument('--json', help="write the report to this JSON file")
+    parser.add_argument('--history', help="append the report as one JSON line to this file")
+    args = parser.parse_args()
+
+    print("="*70)
+    print("⏱️  SETUP STARTUP IMPORT REPORT")
+    print("="*70)
+    report = build_report(args.modules, args.runs, args.top)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Report written to {args.json}")
+    if args.history:
+        with open(args.history, 'a') as f:
+            f.write(json.dumps(report) + '\n')
+        print(f"📈 Appended to {args.history}")
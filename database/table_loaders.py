@@ -0,0 +1,183 @@
+"""
+EPAM Practice Database - Table Loaders
+Stream generated rows into SQLite, either in this process or in a pool of
+worker processes.
+
+TableLoader inserts each table as soon as it is requested. ParallelTableLoader
+hands every table (or sales month) to a worker process that writes it into its
+own staging SQLite file; finish() then merges the staging files into the main
+database with ATTACH + INSERT ... SELECT, in the same order the serial loader
+would have inserted them. Every task gets its own seed derived from the run
+seed, so both loaders produce identical tables.
+"""
+
+import importlib
+import os
+import shutil
+import sqlite3
+import tempfile
+from itertools import islice
+
+from build_phases import NO_PHASES
+from python_generators import derive_seed
+
+DEFAULT_CHUNK_SIZE = 50000
+COMMIT_MODES = ['table', 'chunk']
+
+
+def insert_in_chunks(conn, insert_sql, rows, chunk_size=DEFAULT_CHUNK_SIZE, commit_every='table',
+                     phases=NO_PHASES):
+    """Stream rows into executemany() chunk_size rows at a time
+
+    rows can be any iterable (normally one of the generate_* generators), so
+    at most one chunk is materialized. commit_every='chunk' commits after each
+    chunk, 'table' once after the last one and None leaves the commit to the
+    caller. Generating, inserting and committing are timed as separate
+    phases (see build_phases.py). Returns the number of rows inserted.
+    """
+    cursor = conn.cursor()
+    rows = iter(rows)
+    inserted = 0
+
+    while True:
+        with phases.phase('generate'):
+            chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        phases.add_rows('generate', len(chunk))
+        with phases.phase('insert', len(chunk)):
+            cursor.executemany(insert_sql, chunk)
+        inserted += len(chunk)
+        if commit_every == 'chunk':
+            with phases.phase('commit'):
+                conn.commit()
+
+    if commit_every == 'table':
+        with phases.phase('commit'):
+            conn.commit()
+    return inserted
+
+
+def build_staging_table(generators_module, staging_path, table, insert_sql,
+                        generator_name, args, seed, chunk_size):
+    """Worker: generate one table (or partition) into its own staging database"""
+    generators = importlib.import_module(generators_module)
+    num_columns = insert_sql.count('?')
+
+    conn = sqlite3.connect(staging_path)
+    conn.execute('PRAGMA journal_mode = OFF')
+    conn.execute('PRAGMA synchronous = OFF')
+    conn.execute(f"CREATE TABLE {table} ({', '.join(f'c{i}' for i in range(num_columns))})")
+    rows = getattr(generators, generator_name)(*args, seed=seed)
+    inserted = insert_in_chunks(conn, insert_sql, rows, chunk_size)
+    conn.close()
+    return staging_path, inserted
+
+
+class TableLoader:
+    """Generate tables straight into the main database, one after another
+
+    Use it as a context manager: leaving the with-block calls close(), so
+    worker processes and staging files go away even when a build fails.
+    """
+
+    def __init__(self, conn, generators, chunk_size=DEFAULT_CHUNK_SIZE, commit_every='table', seed=None,
+                 phases=NO_PHASES):
+        self.conn = conn
+        self.generators = generators
+        self.chunk_size = chunk_size
+        self.commit_every = commit_every
+        self.seed = seed
+        self.phases = phases
+
+    def table_seed(self, table):
+        """Seed of a whole table; partition seeds are derived from it"""
+        return derive_seed(self.seed, table)
+
+    def load(self, table, insert_sql, generator_name, *args):
+        """Generate a table with generators.<generator_name>(*args, seed=...)"""
+        self._run(table, insert_sql, [(generator_name, args, self.table_seed(table))])
+
+    def load_partitioned(self, table, insert_sql, partitions, generator_name, *args):
+        """Generate a table partition by partition (e.g. sales by month)
+
+        partitions come from generators.sales_partitions(..., loader.table_seed(table));
+        partition i is generated with generator_name(*partition, *args, seed=...).
+        """
+        table_seed = self.table_seed(table)
+        tasks = [
+            (generator_name, tuple(partition) + args, derive_seed(table_seed, index))
+            for index, partition in enumerate(partitions)
+        ]
+        self._run(table, insert_sql, tasks)
+
+    def _run(self, table, insert_sql, tasks):
+        for generator_name, args, seed in tasks:
+            rows = getattr(self.generators, generator_name)(*args, seed=seed)
+            insert_in_chunks(self.conn, insert_sql, rows, self.chunk_size, self.commit_every, self.phases)
+
+    def finish(self):
+        """Nothing is pending when tables are loaded in-process"""
+
+    def close(self):
+        """Release workers and temporary files (none in-process)"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ParallelTableLoader(TableLoader):
+    """Generate tables in worker processes and merge them on finish()"""
+
+    def __init__(self, conn, generators, workers, db_path, chunk_size=DEFAULT_CHUNK_SIZE,
+                 commit_every='table', seed=None, phases=NO_PHASES):
+        super().__init__(conn, generators, chunk_size, commit_every, seed, phases)
+        from concurrent.futures import ProcessPoolExecutor  # Only parallel runs pay for multiprocessing
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+        # Staging files live next to the database so the merge stays on one disk
+        self.staging_dir = tempfile.mkdtemp(prefix='epam_staging_',
+                                            dir=os.path.dirname(os.path.abspath(db_path)))
+        self.pending = []
+
+    def _run(self, table, insert_sql, tasks):
+        futures = []
+        for index, (generator_name, args, seed) in enumerate(tasks):
+            staging_path = os.path.join(self.staging_dir, f'{table}_{index:03d}.db')
+            futures.append(self.executor.submit(
+                build_staging_table, self.generators.__name__, staging_path, table,
+                insert_sql, generator_name, args, seed, self.chunk_size
+            ))
+        self.pending.append((table, futures))
+
+    def finish(self):
+        """Wait for the workers and merge every staging file in submission order"""
+        cursor = self.conn.cursor()
+        try:
+            for table, futures in self.pending:
+                merged = 0
+                for future in futures:
+                    # Waiting for a worker is the part of its generation this process sees
+                    with self.phases.phase('generate'):
+                        staging_path, inserted = future.result()
+                    self.phases.add_rows('generate', inserted)
+                    self.conn.commit()  # ATTACH is not allowed inside a transaction
+                    cursor.execute('ATTACH DATABASE ? AS staging', (staging_path,))
+                    with self.phases.phase('insert', inserted):
+                        cursor.execute(f'INSERT INTO main.{table} SELECT * FROM staging.{table} ORDER BY rowid')
+                    with self.phases.phase('commit'):
+                        self.conn.commit()
+                    cursor.execute('DETACH DATABASE staging')
+                    os.remove(staging_path)
+                    merged += inserted
+                print(f"🔀 Merged {table} from {len(futures)} staging file(s) ({merged:,} records)")
+            self.pending = []
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the workers and delete the staging files; safe to call twice"""
+        self.executor.shutdown(cancel_futures=True)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)